@@ -5,36 +5,53 @@
 # SPDX-License-Identifier: MIT
 """FEMlium main module."""
 
+import importlib
+import importlib.util
+import typing
+
 from femlium.base_mesh_plotter import BaseMeshPlotter
 from femlium.base_plotter import BasePlotter
 from femlium.base_solution_plotter import BaseSolutionPlotter
 from femlium.domain_plotter import DomainPlotter
-from femlium.numpy_plotter import NumpyPlotter
-
-try:
-    import meshio
-except ImportError:  # pragma: no cover
-    pass
-else:
-    from femlium.meshio_plotter import MeshioPlotter
-
-try:
-    import dolfin
-except ImportError:
-    pass
-else:
-    from femlium.dolfin_plotter import DolfinPlotter
-
-try:
-    import dolfinx
-except ImportError:
-    pass
-else:
-    from femlium.dolfinx_plotter import DolfinxPlotter
-
-try:
-    import firedrake
-except ImportError:
-    pass
-else:
-    from femlium.firedrake_plotter import FiredrakePlotter
+from femlium.numpy_plotter import from_triangle_list, NumpyPlotter
+
+# Optional plotters are only imported upon first access, since their backends may be slow to import
+_optional_plotters = {
+    "MeshioPlotter": ("meshio", "femlium.meshio_plotter"),
+    "DolfinPlotter": ("dolfin", "femlium.dolfin_plotter"),
+    "DolfinxPlotter": ("dolfinx", "femlium.dolfinx_plotter"),
+    "FiredrakePlotter": ("firedrake", "femlium.firedrake_plotter")
+}
+
+
+def _available_optional_plotters() -> list[str]:
+    """List optional plotters whose backend is available, without importing either of them."""
+    return [
+        name for (name, (backend, _)) in _optional_plotters.items() if importlib.util.find_spec(backend) is not None]
+
+
+__all__ = [
+    "BaseMeshPlotter",
+    "BasePlotter",
+    "BaseSolutionPlotter",
+    "DomainPlotter",
+    "from_triangle_list",
+    "NumpyPlotter",
+    *_available_optional_plotters()
+]
+
+
+def __getattr__(name: str) -> typing.Any:  # noqa: ANN401
+    """Import an optional plotter upon first access, provided that its backend is available."""
+    if name in _optional_plotters:
+        (backend, module) = _optional_plotters[name]
+        if importlib.util.find_spec(backend) is not None:
+            plotter = getattr(importlib.import_module(module), name)
+            globals()[name] = plotter
+            return plotter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    """List module attributes, including optional plotters whose backend is available but not yet imported."""
+    return sorted({*globals(), *_available_optional_plotters()})
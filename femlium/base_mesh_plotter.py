@@ -8,7 +8,6 @@
 import typing
 
 import folium
-import geojson
 import numpy as np
 import numpy.typing
 
@@ -71,6 +70,156 @@ class BaseMeshPlotter(BasePlotter):
             the face_colors argument.
             If not provided, a unit weight will be used.
         """
+        (cell_markers, face_markers, unique_cell_markers, unique_face_markers, cell_colors, face_colors,
+         face_weights) = self._process_mesh_arguments(
+            cells, cell_markers, face_markers, cell_colors, face_colors, face_weights)
+
+        json = self._convert_mesh_to_geojson(
+            vertices, cells, cell_markers, face_markers, cell_colors, face_colors, face_weights)
+        self.add_mesh_geojson_to(geo_map, json)
+
+        cell_colors_values = np.arange(0, cell_colors.shape[0])
+        cell_colors_in_figure_mask = (cell_colors != "none") & np.isin(cell_colors_values, unique_cell_markers)
+        cell_colors_in_figure = cell_colors[cell_colors_in_figure_mask]
+        cell_colors_values_in_figure = cell_colors_values[cell_colors_in_figure_mask]
+        if np.unique(cell_colors_in_figure).shape[0] > 1:
+            colorbar = ColorbarWrapper(
+                colors=cell_colors_in_figure, values=cell_colors_values_in_figure, caption="Cell markers")
+            colorbar.add_to(geo_map)
+
+        face_colors_values = np.arange(0, face_colors.shape[0])
+        face_colors_in_figure_mask = np.isin(face_colors_values, unique_face_markers)
+        face_colors_in_figure = face_colors[face_colors_in_figure_mask]
+        face_colors_values_in_figure = face_colors_values[face_colors_in_figure_mask]
+        if np.unique(face_colors_in_figure).shape[0] > 1:
+            colorbar = ColorbarWrapper(
+                colors=face_colors_in_figure, values=face_colors_values_in_figure, caption="Face markers")
+            colorbar.add_to(geo_map)
+
+    def mesh_to_geojson(
+        self, vertices: np.typing.NDArray[np.float64], cells: np.typing.NDArray[np.int64],
+        cell_markers: typing.Optional[np.typing.NDArray[np.int64]] = None,
+        face_markers: typing.Optional[np.typing.NDArray[np.int64]] = None,
+        cell_colors: typing.Optional[typing.Union[str, dict[int, str]]] = None,
+        face_colors: typing.Optional[typing.Union[str, dict[int, str]]] = None,
+        face_weights: typing.Optional[typing.Union[int, dict[int, int]]] = None
+    ) -> dict[str, typing.Any]:
+        """
+        Convert a triangular mesh to a geojson FeatureCollection, without adding it to a folium map.
+
+        The returned FeatureCollection can be stored by the caller (e.g., as a string obtained with json.dumps)
+        and added to several maps by means of add_mesh_geojson_to, without converting the mesh again.
+
+        Parameters
+        ----------
+        vertices
+            Matrix containing the coordinates of the vertices.
+            The matrix should have as many rows as vertices in the mesh, and two columns.
+        cells
+            Matrix containing the connectivity of the cells.
+            The matrix should have as many rows as cells in the mesh, and three columns.
+        cell_markers
+            Vector containing a marker (i.e., an integer number) for each cell.
+            The vector should have as many entries as cells in the mesh.
+            If not provided, the marker will be set to 0 everywhere.
+        face_markers
+            Matrix containing a marker (i.e., an integer number) for each face.
+            The matrix should have the same shape of the cells argument.
+            Given a row index r, the entry face_markers[r, 0] is the marker of the
+            face connecting the first and second vertex of the r-th cell.
+            Similarly, face_markers[r, 1] is the marker associated to the face connecting
+            the second and third vertex of the r-th cell. Finally, face_markers[r, 2] is
+            the marker associated to the face connecting the first and third vertex of the
+            r-th cell.
+            If not provided, the marker will be set to 0 everywhere.
+        cell_colors
+            If a dictionary is provided, it should contain key: value pairs defining the mapping
+            marker: color for cells.
+            If a string is provided instead of a dictionary, the same color will be used for all
+            cell markers.
+            If not provided, the cells will not be colored.
+        face_colors
+            If a dictionary is provided, it should contain key: value pairs defining the mapping
+            marker: color for faces.
+            If a string is provided instead of a dictionary, the same color will be used for all
+            face markers.
+            If not provided, a default black color will be used for faces.
+        face_weights
+            Line weight of each face. Input should be provided following a similar convention for
+            the face_colors argument.
+            If not provided, a unit weight will be used.
+
+        Returns
+        -------
+        :
+            A geojson FeatureCollection representing the mesh.
+        """
+        (cell_markers, face_markers, _, _, cell_colors, face_colors, face_weights) = self._process_mesh_arguments(
+            cells, cell_markers, face_markers, cell_colors, face_colors, face_weights)
+        return self._convert_mesh_to_geojson(
+            vertices, cells, cell_markers, face_markers, cell_colors, face_colors, face_weights)
+
+    def add_mesh_geojson_to(
+        self, geo_map: folium.Map, mesh_geojson: typing.Union[str, dict[str, typing.Any]]
+    ) -> None:
+        """
+        Add a triangular mesh, previously converted by mesh_to_geojson, to a folium map.
+
+        Note that colorbars are not added by this method.
+
+        Parameters
+        ----------
+        geo_map
+            Map to which the mesh plot should be added.
+        mesh_geojson
+            Geojson FeatureCollection returned by mesh_to_geojson, or its serialization to a string.
+        """
+        folium.GeoJson(mesh_geojson, style_function=self._mesh_style_function).add_to(geo_map)
+
+    @staticmethod
+    def _mesh_style_function(x: dict[str, dict[str, typing.Any]]) -> dict[str, typing.Any]:
+        """Style a feature of the geojson FeatureCollection representing the mesh."""
+        if x["geometry"]["type"] == "MultiPolygon":
+            return {
+                # Boundary properties
+                "stroke": x["properties"]["stroke"],
+                "color": x["properties"]["color"],
+                "weight": x["properties"]["weight"],
+                # Interior properties
+                "fill": x["properties"]["fill"],
+                "fillColor": x["properties"]["fillColor"],
+                "fillOpacity": x["properties"]["fillOpacity"]
+            }
+        elif x["geometry"]["type"] == "MultiLineString":
+            return {
+                "stroke": x["properties"]["stroke"],
+                "color": x["properties"]["color"],
+                "weight": x["properties"]["weight"]
+            }
+        else:  # pragma: no cover
+            raise ValueError("Invalid type")
+
+    def _process_mesh_arguments(
+        self, cells: np.typing.NDArray[np.int64],
+        cell_markers: typing.Optional[np.typing.NDArray[np.int64]],
+        face_markers: typing.Optional[np.typing.NDArray[np.int64]],
+        cell_colors: typing.Optional[typing.Union[str, dict[int, str]]],
+        face_colors: typing.Optional[typing.Union[str, dict[int, str]]],
+        face_weights: typing.Optional[typing.Union[int, dict[int, int]]]
+    ) -> tuple[
+        np.typing.NDArray[np.int64], np.typing.NDArray[np.int64], np.typing.NDArray[np.int64],
+        np.typing.NDArray[np.int64], np.typing.NDArray[np.str_], np.typing.NDArray[np.str_],
+        np.typing.NDArray[np.int64]
+    ]:
+        """
+        Fill optional arguments of add_mesh_to and mesh_to_geojson with their default values.
+
+        Returns
+        -------
+        :
+            A tuple containing cell markers, face markers, unique cell markers, unique face markers,
+            and the vectors associating markers to cell colors, face colors and face weights.
+        """
         if cell_markers is None:
             cell_markers = np.zeros((cells.shape[0], ), dtype=np.int64)
         else:
@@ -86,63 +235,16 @@ class BaseMeshPlotter(BasePlotter):
         cell_colors = self._process_optional_argument_on_markers(cell_colors, "none", unique_cell_markers)
         face_colors = self._process_optional_argument_on_markers(face_colors, "black", unique_face_markers)
         face_weights = self._process_optional_argument_on_markers(face_weights, 1, unique_face_markers)
-
-        def style_function(x: dict[str, dict[str, typing.Any]]) -> dict[str, typing.Any]:
-            if x["geometry"]["type"] == "MultiPolygon":
-                return {
-                    # Boundary properties
-                    "stroke": x["properties"]["stroke"],
-                    "color": x["properties"]["color"],
-                    "weight": x["properties"]["weight"],
-                    # Interior properties
-                    "fill": x["properties"]["fill"],
-                    "fillColor": x["properties"]["fillColor"],
-                    "fillOpacity": x["properties"]["fillOpacity"]
-                }
-            elif x["geometry"]["type"] == "MultiLineString":
-                return {
-                    "stroke": x["properties"]["stroke"],
-                    "color": x["properties"]["color"],
-                    "weight": x["properties"]["weight"]
-                }
-            else:  # pragma: no cover
-                raise ValueError("Invalid type")
-
-        json = self._convert_mesh_to_geojson(
-            vertices, cells, cell_markers, face_markers, cell_colors, face_colors, face_weights)
-        folium.GeoJson(json, style_function=style_function).add_to(geo_map)
-
-        cell_colors_where_none = np.argwhere(cell_colors == "none")
-        cell_colors_not_none = np.delete(cell_colors, cell_colors_where_none)
-        cell_colors_values = np.arange(0, np.max(unique_cell_markers) + 1)
-        cell_colors_values_not_none = np.delete(cell_colors_values, cell_colors_where_none)
-        assert cell_colors_not_none.shape == cell_colors_values_not_none.shape
-        cell_colors_in_figure = np.delete(
-            cell_colors_not_none, np.setdiff1d(cell_colors_values_not_none, unique_cell_markers))
-        cell_colors_values_in_figure = np.delete(
-            cell_colors_values_not_none, np.setdiff1d(cell_colors_values_not_none, unique_cell_markers))
-        if np.unique(cell_colors_in_figure).shape[0] > 1:
-            colorbar = ColorbarWrapper(
-                colors=cell_colors_in_figure, values=cell_colors_values_in_figure, caption="Cell markers")
-            colorbar.add_to(geo_map)
-
-        face_colors_values = np.arange(0, np.max(unique_face_markers) + 1)
-        assert face_colors.shape == face_colors_values.shape
-        face_colors_in_figure = np.delete(
-            face_colors, np.setdiff1d(face_colors_values, unique_face_markers))
-        face_colors_values_in_figure = np.delete(
-            face_colors_values, np.setdiff1d(face_colors_values, unique_face_markers))
-        if np.unique(face_colors_in_figure).shape[0] > 1:
-            colorbar = ColorbarWrapper(
-                colors=face_colors_in_figure, values=face_colors_values_in_figure, caption="Face markers")
-            colorbar.add_to(geo_map)
+        return (
+            cell_markers, face_markers, unique_cell_markers, unique_face_markers, cell_colors, face_colors,
+            face_weights)
 
     def _convert_mesh_to_geojson(
         self, vertices: np.typing.NDArray[np.float64], cells: np.typing.NDArray[np.int64],
         cell_markers: np.typing.NDArray[np.int64], face_markers: np.typing.NDArray[np.int64],
         cell_colors: typing.Union[str, dict[int, str]], face_colors: typing.Union[str, dict[int, str]],
         face_weights: typing.Union[int, dict[int, int]]
-    ) -> geojson.FeatureCollection:
+    ) -> dict[str, typing.Any]:
         """
         Convert a mesh to a geojson FeatureCollection.
 
@@ -175,89 +277,179 @@ class BaseMeshPlotter(BasePlotter):
         :
             A geojson FeatureCollection representing the mesh.
         """
-        multipolygon_coordinates = dict()
-        multipolygon_properties = dict()
-        multiline_coordinates = dict()
-        multiline_properties = dict()
-        for c in range(cells.shape[0]):
-            coordinates = [self.transformer(*vertices[cells[c, v], :]) for v in range(3)]
-            coordinates.append(coordinates[0])
-            cell_face_markers = np.unique([face_markers[c, f] for f in range(3)]).astype(np.int64)
-            if cell_face_markers.shape[0] == 1:
-                cell_key = (cell_markers[c], True)
-                cell_properties = {
-                    # Boundary properties
-                    "stroke": True,
-                    "color": face_colors[cell_face_markers[0]],
-                    "weight": int(face_weights[cell_face_markers[0]]),
-                }
-            else:
-                cell_key = (cell_markers[c], False)
-                cell_properties = {
-                    # Boundary properties
-                    "stroke": False,
-                    "color": None,
-                    "weight": None
-                }
-            if cell_colors[cell_key[0]] != "none":
-                cell_properties.update({
-                    # Interior properties
-                    "fill": True,
-                    "fillColor": cell_colors[cell_key[0]],
-                    "fillOpacity": 1
-                })
-            else:
-                cell_properties.update({
-                    # Interior properties
-                    "fill": False,
-                    "fillColor": None,
-                    "fillOpacity": None
-                })
-            # Store current cell
-            if cell_key not in multipolygon_coordinates:
-                multipolygon_coordinates[cell_key] = list()
-            multipolygon_coordinates[cell_key].append([coordinates])
-            # Store current cell properties
-            if cell_key not in multipolygon_properties:
-                multipolygon_properties[cell_key] = cell_properties
-            else:
-                assert multipolygon_properties[cell_key] == cell_properties
-            # Store faces only if there are multiple face markers in this cell,
-            # otherwise the boundary representation of the cell is sufficient.
-            if not cell_key[1]:
-                for (f, pair) in enumerate(((0, 1), (1, 2), (0, 2))):
-                    face_key = face_markers[c, f]
-                    # Store current face
-                    if face_key not in multiline_coordinates:
-                        multiline_coordinates[face_key] = list()
-                    multiline_coordinates[face_key].append([coordinates[pair[0]], coordinates[pair[1]]])
-                    # Store current face properties
-                    face_properties = {
-                        "stroke": True,
-                        "color": face_colors[face_markers[c, f]],
-                        "weight": int(face_weights[face_markers[c, f]]),
-                    }
-                    if face_key not in multiline_properties:
-                        multiline_properties[face_key] = face_properties
-                    else:
-                        assert multiline_properties[face_key] == face_properties
+        transformed_vertices = self._transform_vertices(vertices)
+        unique_face_markers = np.unique(face_markers)
+        single_face_marker = unique_face_markers.shape[0] == 1
+        if single_face_marker:
+            # Fast path for the common case of a single face marker: all cells have the same marker on every face,
+            # and their boundary representation is sufficient, so face markers need not be inspected cell by cell
+            cell_face_markers_all_equal = np.ones(cells.shape[0], dtype=np.bool_)
+        else:
+            cell_face_markers_all_equal = self._classify_cells(face_markers)
+
+        # Markers with the same appearance are associated to the same index, so that cells (or faces) with
+        # different markers but the same appearance are stored in the same feature
+        _, cell_colors_ids = np.unique(cell_colors, return_inverse=True)
+        _, face_colors_ids = np.unique(face_colors, return_inverse=True)
+        _, face_weights_ids = np.unique(face_weights, return_inverse=True)
+        _, face_properties_ids = np.unique(
+            face_colors_ids * (np.max(face_weights_ids) + 1) + face_weights_ids, return_inverse=True)
+
+        # Colors and weights are converted at once to native python types, which are then used as they are
+        # in the geojson properties, without any further conversion
+        cell_colors_list = cell_colors.tolist()
+        face_colors_list = face_colors.tolist()
+        face_weights_list = face_weights.tolist()
+        face_properties_table = {
+            face_key: {
+                "stroke": True,
+                "color": face_colors_list[face_key],
+                "weight": face_weights_list[face_key],
+            } for face_key in unique_face_markers.tolist()
+        }
+
+        # Group cells sharing the same interior color and the same boundary appearance. Cells with multiple
+        # face markers do not draw their boundary, and are thus associated to a boundary index equal to zero,
+        # while boundary indices of cells with a single face marker are shifted by one. The interior color index
+        # and the boundary index are then packed in a single integer key.
+        cells_boundary_ids = np.where(cell_face_markers_all_equal, face_properties_ids[face_markers[:, 0]] + 1, 0)
+        cells_groups = self._group_by_first_occurrence(
+            cell_colors_ids[cell_markers].astype(np.int64) * (np.max(face_properties_ids) + 2) + cells_boundary_ids)
 
         multipolygon_features = list()
-        for cell_key in multipolygon_coordinates.keys():
-            multipolygon = geojson.MultiPolygon(coordinates=multipolygon_coordinates[cell_key])
-            feature = geojson.Feature(
-                geometry=multipolygon,
-                properties=multipolygon_properties[cell_key]
-            )
-            multipolygon_features.append(feature)
+        for group in cells_groups:
+            if cell_face_markers_all_equal[group[0]]:
+                boundary_properties = face_properties_table[int(face_markers[group[0], 0])]
+            else:
+                boundary_properties = None
+            multipolygon_features.append({
+                "type": "Feature",
+                "geometry": {
+                    "type": "MultiPolygon",
+                    # Store all cells in the current group
+                    "coordinates": transformed_vertices[cells[group][:, np.newaxis, [0, 1, 2, 0]], :].tolist()
+                },
+                "properties": self._cell_properties(cell_colors_list[cell_markers[group[0]]], boundary_properties)
+            })
 
+        # Store faces only for cells with multiple face markers, otherwise the boundary representation
+        # of the cell is sufficient.
         multiline_features = list()
-        for face_key in multiline_coordinates.keys():
-            multiline = geojson.MultiLineString(coordinates=multiline_coordinates[face_key])
-            feature = geojson.Feature(
-                geometry=multiline,
-                properties=multiline_properties[face_key]
-            )
-            multiline_features.append(feature)
-
-        return geojson.FeatureCollection(multipolygon_features + multiline_features)
+        mixed_cells = np.flatnonzero(~cell_face_markers_all_equal)
+        if mixed_cells.shape[0] > 0:
+            # Collect all faces of cells with multiple face markers in a matrix with two columns, with rows
+            # ordered first by cell and then by face, following the same convention used in face_markers
+            mixed_faces = cells[mixed_cells][:, [[0, 1], [1, 2], [0, 2]]].reshape(-1, 2)
+            mixed_faces_markers = face_markers[mixed_cells].reshape(-1)
+            # Faces shared by two cells with multiple face markers are stored only once, upon their first occurrence
+            first_faces = self._first_occurrence_of_faces(mixed_faces, vertices.shape[0])
+            mixed_faces = mixed_faces[first_faces]
+            mixed_faces_markers = mixed_faces_markers[first_faces]
+            mixed_faces_coordinates = transformed_vertices[mixed_faces, :]
+            # Group faces sharing the same appearance
+            for group in self._group_by_first_occurrence(face_properties_ids[mixed_faces_markers]):
+                multiline_features.append({
+                    "type": "Feature",
+                    "geometry": {
+                        "type": "MultiLineString",
+                        # Store all faces in the current group
+                        "coordinates": mixed_faces_coordinates[group].tolist()
+                    },
+                    "properties": face_properties_table[int(mixed_faces_markers[group[0]])]
+                })
+
+        return {"type": "FeatureCollection", "features": multipolygon_features + multiline_features}
+
+    @staticmethod
+    def _cell_properties(
+        cell_color: str, boundary_properties: typing.Optional[dict[str, typing.Any]]
+    ) -> dict[str, typing.Any]:
+        """
+        Compute the properties of the polygons representing a group of cells.
+
+        Parameters
+        ----------
+        cell_color
+            Color of the interior of the cells, or "none" if the interior should not be colored.
+        boundary_properties
+            Properties of the face marker shared by all faces of the cells, or None if the cells
+            have multiple face markers and hence their boundary should not be drawn.
+
+        Returns
+        -------
+        :
+            A dictionary containing boundary and interior properties.
+        """
+        if boundary_properties is not None:
+            cell_properties = dict(boundary_properties)
+        else:
+            cell_properties = {
+                # Boundary properties
+                "stroke": False,
+                "color": None,
+                "weight": None
+            }
+        if cell_color != "none":
+            cell_properties.update({
+                # Interior properties
+                "fill": True,
+                "fillColor": cell_color,
+                "fillOpacity": 1
+            })
+        else:
+            cell_properties.update({
+                # Interior properties
+                "fill": False,
+                "fillColor": None,
+                "fillOpacity": None
+            })
+        return cell_properties
+
+    @staticmethod
+    def _classify_cells(face_markers: np.typing.NDArray[np.int64]) -> np.typing.NDArray[np.bool_]:
+        """
+        Determine, for every cell at once, whether all its faces share the same marker.
+
+        Parameters
+        ----------
+        face_markers
+            Matrix containing a marker (i.e., an integer number) for each face.
+            The matrix should have as many rows as cells in the mesh, and three columns.
+
+        Returns
+        -------
+        :
+            Vector containing True for cells whose three faces have the same marker, and False otherwise.
+        """
+        return (face_markers[:, 0] == face_markers[:, 1]) & (face_markers[:, 1] == face_markers[:, 2])
+
+    @staticmethod
+    def _first_occurrence_of_faces(
+        faces: np.typing.NDArray[np.int64], num_vertices: int
+    ) -> np.typing.NDArray[np.bool_]:
+        """
+        Determine which faces are visited for the first time, when looping over them.
+
+        Parameters
+        ----------
+        faces
+            Matrix containing the connectivity of the faces.
+            The matrix should have as many rows as faces, and two columns.
+            The same face may appear multiple times, possibly with its vertices in a different order.
+        num_vertices
+            Number of vertices in the mesh.
+
+        Returns
+        -------
+        :
+            Vector containing True if the corresponding face did not appear in any previous row, and False otherwise.
+        """
+        # Canonicalize each face by ordering its vertices with elementwise minimum and maximum, which are
+        # cheaper than sorting each row, and pack the resulting pair in a single integer key
+        faces_keys = np.minimum(faces[:, 0], faces[:, 1]).astype(np.int64)
+        faces_keys *= num_vertices
+        faces_keys += np.maximum(faces[:, 0], faces[:, 1])
+        _, first_occurrence = np.unique(faces_keys, return_index=True)
+        first_faces = np.zeros(faces_keys.shape, dtype=np.bool_)
+        first_faces[first_occurrence] = True
+        return first_faces
@@ -5,6 +5,7 @@
 # SPDX-License-Identifier: MIT
 """Interface of a geographic plotter."""
 
+import functools
 import typing
 
 import numpy as np
@@ -33,32 +34,137 @@ class BasePlotter:
 
     def __init__(self, transformer: typing.Optional[pyproj.Transformer] = None) -> None:
         self.transformer = TransformerWrapper(transformer)
+        # Cache of the transformed vertices of the last mesh, since the same mesh is often used in several plots
+        self._transformed_vertices_cache: typing.Optional[tuple[
+            np.typing.NDArray[np.float64], np.typing.NDArray[np.float64]]] = None
+
+    def _transform_coordinates(self, coordinates: np.typing.NDArray[np.float64]) -> np.typing.NDArray[np.float64]:
+        """
+        Transform several points at once, and round their coordinates for the generation of geojson data.
+
+        Coordinates are rounded to six decimal places, as in the default precision of the geojson library.
+        This corresponds to a precision of roughly ten centimeters on the map, and keeps the serialized
+        coordinates short. Rounding is preferred to a conversion to single precision, since single precision
+        numbers are converted back to double precision floats with several spurious digits when serialized.
+
+        Parameters
+        ----------
+        coordinates
+            Matrix containing the input coordinates.
+            The matrix should have as many rows as points, and two columns.
+
+        Returns
+        -------
+        :
+            Matrix containing the output coordinates after transformation and rounding.
+        """
+        return np.round(self.transformer.batch(coordinates), 6)
+
+    def _transform_vertices(self, vertices: np.typing.NDArray[np.float64]) -> np.typing.NDArray[np.float64]:
+        """
+        Transform the vertices of a mesh, reusing the result of the previous call on the same vertices.
+
+        Parameters
+        ----------
+        vertices
+            Matrix containing the coordinates of the vertices.
+            The matrix should have as many rows as vertices in the mesh, and two columns.
+
+        Returns
+        -------
+        :
+            Matrix containing the coordinates of the vertices after transformation and rounding.
+            The returned matrix is shared between calls, hence it is read-only.
+        """
+        if self._transformed_vertices_cache is not None and (
+            self._transformed_vertices_cache[0].shape == vertices.shape
+            and np.array_equal(self._transformed_vertices_cache[0], vertices)
+        ):
+            return self._transformed_vertices_cache[1]
+        transformed_vertices = self._transform_coordinates(vertices)
+        transformed_vertices.setflags(write=False)
+        # Store a copy of the input vertices, so that the cache is not affected by later changes to the input
+        self._transformed_vertices_cache = (np.array(vertices), transformed_vertices)
+        return transformed_vertices
 
     @staticmethod
     def _process_optional_argument_on_markers(
         argument: typing.Any, default: typing.Any, unique_markers: np.typing.NDArray[typing.Any]  # noqa: ANN401
     ) -> np.typing.NDArray[typing.Any]:
-        """Fill optinal arguments related to markers with default value."""
+        """
+        Fill optinal arguments related to markers with default value.
+
+        Unique markers are expected to be sorted, as returned by np.unique.
+        Results are cached, since the same mesh is often plotted several times with the same arguments:
+        the returned array is thus read-only.
+        """
         expected_type = type(default)
         assert isinstance(argument, (expected_type, dict)) or argument is None
         if isinstance(argument, dict):
             assert all(isinstance(value, expected_type) for (_, value) in argument.items())
+            argument = tuple(sorted((int(marker), value) for (marker, value) in argument.items()))
+
+        # Unique markers are sorted, hence their minimum is the first entry
+        assert unique_markers[0] >= 0
+        return _expand_markers(argument, default, np.asarray(unique_markers, dtype=np.int64).tobytes())
+
+    @staticmethod
+    def _group_by_first_occurrence(keys: np.typing.NDArray[np.int64]) -> list[np.typing.NDArray[np.int64]]:
+        """
+        Group entries sharing the same key.
+
+        Parameters
+        ----------
+        keys
+            Vector containing the key of each entry.
+
+        Returns
+        -------
+        :
+            A list of vectors, each one containing the indices of the entries in a group.
+            Groups are sorted by the position of their first entry, and entries in each group are sorted as well,
+            so that the order in which entries appear is preserved.
+        """
+        if keys.shape[0] == 0:
+            return []
+        # Since the sort is stable, the first entry of each group is the first entry with that key,
+        # and sorting groups by their first entry preserves the order in which groups appear.
+        order = np.argsort(keys, kind="stable")
+        groups = np.split(order, np.flatnonzero(np.diff(keys[order]) != 0) + 1)
+        groups.sort(key=lambda group: group[0])
+        return groups
+
+
+@functools.lru_cache(maxsize=64)
+def _expand_markers(
+    argument: typing.Any, default: typing.Any, unique_markers_bytes: bytes  # noqa: ANN401
+) -> np.typing.NDArray[typing.Any]:
+    """Fill optinal arguments related to markers with default value, after their normalization to hashable types."""
+    expected_type = type(default)
+    unique_markers = np.frombuffer(unique_markers_bytes, dtype=np.int64)
+    if argument is None:
+        keys = np.zeros((0, ), dtype=np.int64)
+        values = []
+    elif isinstance(argument, expected_type):
+        keys = unique_markers
+        values = [argument]
+    elif isinstance(argument, tuple):
+        # Discard markers which are not present in the mesh
+        keys = np.fromiter((marker for (marker, _) in argument), dtype=np.int64, count=len(argument))
+        values = [value for (_, value) in argument]
+        keys_mask = np.isin(keys, unique_markers)
+        keys = keys[keys_mask]
+        values = [value for (value, keep) in zip(values, keys_mask.tolist()) if keep]
+    else:  # pragma: no cover
+        raise ValueError("Invalid argument provided")
 
-        if isinstance(default, str):
-            dtype = np.dtype(object)  # otherwise np.dtype(str) only allows a single character
-        else:
-            dtype = np.dtype(expected_type)
-
-        assert np.min(unique_markers) >= 0
-        output = np.full(np.max(unique_markers) + 1, default, dtype=dtype)
-        for m in unique_markers:
-            if argument is None:
-                pass
-            elif isinstance(argument, expected_type):
-                output[m] = argument
-            elif isinstance(argument, dict):
-                if m in argument:
-                    output[m] = argument[m]
-            else:  # pragma: no cover
-                raise ValueError("Invalid argument provided")
-        return output
+    if isinstance(default, str):
+        # Let numpy infer the width of the string dtype from the longest entry, rather than using an object array
+        dtype = np.array([default, *values]).dtype
+    else:
+        dtype = np.dtype(expected_type)
+    # Unique markers are sorted, hence their maximum is the last entry
+    output = np.full(unique_markers[-1] + 1, default, dtype=dtype)
+    output[keys] = np.array(values, dtype=dtype)
+    output.setflags(write=False)
+    return output
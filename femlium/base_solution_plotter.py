@@ -8,24 +8,56 @@
 import typing
 
 import folium
-import geojson
 import matplotlib as mpl
 import matplotlib._tri
 import matplotlib.pyplot as plt
 import numpy as np
 import numpy.typing
+import pyproj
 
 from femlium.base_plotter import BasePlotter
 from femlium.utils import ColorbarWrapper, GeoJsonWithArrows
 
 
 class BaseSolutionPlotter(BasePlotter):
-    """Base interface of a geographic plotter for solution-related plots."""
+    """
+    Base interface of a geographic plotter for solution-related plots.
+
+    Parameters
+    ----------
+    transformer
+        Defines an optional transformation between coordinate reference systems (CRS) if
+        the input data use a different CRS than the output plot.
+        If not provided, the identity map is used.
+    transform_first
+        If True, the vertices of the mesh are transformed before computing contours, so that contours
+        are computed directly in the output CRS and their points do not need to be transformed.
+        This is much faster when contours have many more points than the mesh has vertices, but contour lines
+        are then straight in the output CRS rather than in the input one. Furthermore, it should not be used
+        when the transformed mesh crosses the antimeridian, since cells would be wrapped around the globe.
+        If not provided, contours are computed in the input CRS and then transformed.
+
+    Attributes
+    ----------
+    transformer
+        Wrapper to the transformer object provided as first input parameter.
+    transform_first
+        The second input parameter.
+    """
+
+    def __init__(
+        self, transformer: typing.Optional[pyproj.Transformer] = None, transform_first: bool = False
+    ) -> None:
+        super().__init__(transformer)
+        self.transform_first = transform_first
+        # Cache of the triangulation of the last mesh, since the same mesh is often used to plot several fields
+        self._triangulation_cache: typing.Optional[tuple[
+            np.typing.NDArray[np.float64], np.typing.NDArray[np.int64], matplotlib._tri.Triangulation]] = None
 
     def add_scalar_field_to(
         self, geo_map: folium.Map, vertices: np.typing.NDArray[np.float64], cells: np.typing.NDArray[np.int64],
         scalar_field: np.typing.NDArray[np.float64], mode: typing.Optional[str] = None,
-        levels: typing.Optional[typing.Union[int, list[float]]] = None,
+        levels: typing.Optional[typing.Union[int, list[float], np.typing.NDArray[np.float64]]] = None,
         cmap: typing.Optional[str] = None, name: typing.Optional[str] = None
     ) -> None:
         """
@@ -51,7 +83,7 @@ class BaseSolutionPlotter(BasePlotter):
             Values of the contour lines.
             If integer, it will determine the number of equispaced values to be used between
             the minimum and maximum entry of the scalar field.
-            If list, it will determine the values to be used.
+            If list or numpy array, it will determine the values to be used.
             If not provided, 10 levels are used by default.
         cmap
             matplotlib color map to be used.
@@ -64,11 +96,81 @@ class BaseSolutionPlotter(BasePlotter):
             mode = "contourf"
         assert mode in ("contourf", "contour")
 
+        levels, cmap, cnorm = self._process_levels_and_cmap(scalar_field, levels, cmap)
+
+        if name is None:
+            name = "Scalar field"
+
+        self._add_contours_to(geo_map, vertices, cells, scalar_field, mode, levels, cmap, cnorm, name)
+
+    def _add_contours_to(
+        self, geo_map: folium.Map, vertices: np.typing.NDArray[np.float64], cells: np.typing.NDArray[np.int64],
+        scalar_field: np.typing.NDArray[np.float64], mode: str, levels: np.typing.NDArray[np.float64],
+        cmap: mpl.colors.Colormap, cnorm: mpl.colors.Normalize, name: str
+    ) -> None:
+        """
+        Add a contour plot of a scalar field to a folium map, after all optional arguments have been processed.
+
+        Parameters
+        ----------
+        geo_map
+            Map to which the mesh plot should be added.
+        vertices
+            Matrix containing the coordinates of the vertices.
+            The matrix should have as many rows as vertices in the mesh, and two columns.
+        cells
+            Matrix containing the connectivity of the cells.
+            The matrix should have as many rows as cells in the mesh, and three columns.
+        scalar_field
+            Vector containing the value of the field at each vertex.
+            The vector should have as many entries as vertices in the mesh.
+        mode
+            Plot to be generated, either contourf or contour.
+        levels
+            Values of the contour lines.
+        cmap
+            Color map to be used.
+        cnorm
+            Normalization of the levels to be applied before evaluating the color map.
+        name
+            Name of the field, to be used in the creation of the color bar.
+        """
+        colors = self._colormap_hex_table(cmap)[self._colormap_indices(cmap, cnorm(levels))].tolist()
+
+        json = self._convert_scalar_field_to_geojson(vertices, cells, scalar_field, mode, levels, colors)
+        folium.GeoJson(json, style_function=self._properties_style_function).add_to(geo_map)
+
+        colorbar = ColorbarWrapper(colors=colors, values=levels, caption=name)
+        colorbar.add_to(geo_map)
+
+    @staticmethod
+    def _process_levels_and_cmap(
+        values: np.typing.NDArray[np.float64],
+        levels: typing.Optional[typing.Union[int, list[float], np.typing.NDArray[np.float64]]],
+        cmap: typing.Optional[typing.Union[str, mpl.colors.Colormap]]
+    ) -> tuple[np.typing.NDArray[np.float64], mpl.colors.Colormap, mpl.colors.Normalize]:
+        """
+        Process the optional levels and color map arguments.
+
+        Parameters
+        ----------
+        values
+            Vector containing the values of the field to be plotted.
+        levels
+            Levels argument, as documented in add_scalar_field_to.
+        cmap
+            Color map argument, as documented in add_scalar_field_to.
+
+        Returns
+        -------
+        :
+            A tuple containing the vector of levels, the color map, and the normalization of the levels.
+        """
         if levels is None:
             levels = 10
         assert isinstance(levels, (int, list, np.ndarray))
         if isinstance(levels, int):
-            levels = np.linspace(scalar_field.min(), scalar_field.max(), levels)
+            levels = np.linspace(values.min(), values.max(), levels)
         elif isinstance(levels, list):
             levels = np.array(levels)
         elif isinstance(levels, np.ndarray):
@@ -81,41 +183,13 @@ class BaseSolutionPlotter(BasePlotter):
         if isinstance(cmap, str):
             cmap = plt.get_cmap(cmap, lut=levels.shape[0])
         cnorm = plt.Normalize(vmin=levels[0], vmax=levels[-1])
-        colors = [mpl.colors.to_hex(cmap(cnorm(lev))) for lev in levels]
-
-        if name is None:
-            name = "Scalar field"
-
-        def style_function(x: dict[str, dict[str, typing.Any]]) -> dict[str, typing.Any]:
-            if x["geometry"]["type"] == "MultiPolygon":
-                assert mode == "contourf"
-                return {
-                    # Boundary properties
-                    "stroke": False,
-                    # Interior properties
-                    "fillColor": x["properties"]["fillColor"],
-                    "fillOpacity": x["properties"]["fillOpacity"]
-                }
-            elif x["geometry"]["type"] == "MultiLineString":
-                assert mode == "contour"
-                return {
-                    "color": x["properties"]["color"],
-                    "weight": x["properties"]["weight"]
-                }
-            else:  # pragma: no cover
-                raise ValueError("Invalid type")
-
-        json = self._convert_scalar_field_to_geojson(vertices, cells, scalar_field, mode, levels, colors)
-        folium.GeoJson(json, style_function=style_function).add_to(geo_map)
-
-        colorbar = ColorbarWrapper(colors=colors, values=levels, caption=name)
-        colorbar.add_to(geo_map)
+        return levels, cmap, cnorm
 
     def _convert_scalar_field_to_geojson(
         self, vertices: np.typing.NDArray[np.float64], cells: np.typing.NDArray[np.int64],
-        scalar_field: np.typing.NDArray[np.float64], mode: str, levels: typing.Union[int, list[float]],
+        scalar_field: np.typing.NDArray[np.float64], mode: str, levels: np.typing.NDArray[np.float64],
         colors: list[str]
-    ) -> geojson.FeatureCollection:
+    ) -> dict[str, typing.Any]:
         """
         Convert a scalar field to a geojson FeatureCollection.
 
@@ -135,7 +209,7 @@ class BaseSolutionPlotter(BasePlotter):
         mode
             Plot to be generated, either contourf or contour.
         levels
-            Values of the contour lines.
+            Vector containing the values of the contour lines, sorted in increasing order.
         colors
             Color associated to each level.
 
@@ -144,97 +218,218 @@ class BaseSolutionPlotter(BasePlotter):
         :
             A geojson FeatureCollection representing the scalar field.
         """
-        tri = mpl.tri.Triangulation(vertices[:, 0], vertices[:, 1], cells)
-        countour_generator = mpl._tri.TriContourGenerator(tri.get_cpp_triangulation(), scalar_field)
-
+        if self.transform_first:
+            countour_generator = self._create_contour_generator(self._transform_vertices(vertices), cells, scalar_field)
+        else:
+            countour_generator = self._create_contour_generator(vertices, cells, scalar_field)
+
+        # Curves of all levels are first collected, and then transformed at once. Levels are traced serially,
+        # since matplotlib contour generators keep the GIL while tracing and store their visited state
+        # on the generator itself, so that they cannot be shared between threads.
+        # Levels which do not intersect the range of the scalar field cannot generate any curve, hence
+        # they are skipped without calling the tracer
+        field_min = scalar_field.min()
+        field_max = scalar_field.max()
+        levels_list = levels.tolist()
+        curves = list()
+        curves_levels = list()
         if mode == "contour":
-            multiline_coordinates = dict()
-            multiline_properties = dict()
-            for lev in range(levels.shape[0]):
-                curves = countour_generator.create_contour(levels[lev])
-                if isinstance(curves, tuple):  # non backward compatible change in matplotlib commit 178012
-                    assert len(curves) == 2
-                    curves = curves[0]
-                assert isinstance(curves, list)
-                for curve in curves:
-                    assert len(curve.shape) == 2
-                    if curve.shape[0] > 1:
-                        coordinates = [self.transformer(*curve[p, :]) for p in range(curve.shape[0])]
-                        # Store current curve coordinates
-                        if lev not in multiline_coordinates:
-                            multiline_coordinates[lev] = list()
-                        multiline_coordinates[lev].append(coordinates)
-                        # Store current curve properties
-                        properties = {
-                            "color": colors[lev],
-                            "weight": 2
-                        }
-                        if lev not in multiline_properties:
-                            multiline_properties[lev] = properties
-                        else:
-                            assert multiline_properties[lev] == properties
+            for (lev, level) in enumerate(levels_list):
+                if level < field_min or level > field_max:
+                    continue
+                for curve in self._create_contour(countour_generator, level):
+                    assert curve.ndim == 2
+                    if len(curve) > 1:
+                        curves.append(curve)
+                        curves_levels.append(lev)
 
             multiline_features = list()
-            for lev in multiline_coordinates.keys():
-                multiline = geojson.MultiLineString(coordinates=multiline_coordinates[lev])
-                feature = geojson.Feature(
-                    geometry=multiline,
-                    properties=multiline_properties[lev]
-                )
-                multiline_features.append(feature)
-
-            return geojson.FeatureCollection(multiline_features)
+            for (lev, level_curves) in self._transform_curves_by_level(curves, curves_levels):
+                multiline_features.append({
+                    "type": "Feature",
+                    "geometry": {"type": "MultiLineString", "coordinates": level_curves},
+                    "properties": {
+                        "color": colors[lev],
+                        "weight": 2
+                    }
+                })
+
+            return {"type": "FeatureCollection", "features": multiline_features}
         elif mode == "contourf":
-            multipolygon_coordinates = dict()
-            multipolygon_properties = dict()
-            for lev in range(levels.shape[0] - 1):
-                filled_contour = countour_generator.create_filled_contour(levels[lev], levels[lev + 1])
-                assert len(filled_contour) == 2
-                if isinstance(filled_contour[0], list):  # non backward compatible change in matplotlib commit 178012
-                    assert isinstance(filled_contour[1], list)
-                    assert len(filled_contour[0]) == 1
-                    assert len(filled_contour[1]) == 1
-                    filled_contour = (np.array(filled_contour[0][0]), np.array(filled_contour[1][0]))
-                assert len(filled_contour[0].shape) == 2
-                assert len(filled_contour[1].shape) == 1
+            for (lev, (lower_level, upper_level)) in enumerate(zip(levels_list[:-1], levels_list[1:])):
+                if upper_level < field_min or lower_level > field_max:
+                    continue
+                filled_contour = self._create_filled_contour(countour_generator, lower_level, upper_level)
                 filled_contour_split = np.split(filled_contour[0], np.where(filled_contour[1] == 1)[0][1:])
-                for i in range(len(filled_contour_split)):
-                    filled_contour_split[i] = np.vstack((filled_contour_split[i], filled_contour_split[i][0, :]))
                 for curve in filled_contour_split:
-                    if curve.shape[0] > 2:
-                        coordinates = [self.transformer(*curve[p, :]) for p in range(curve.shape[0])]
-                        # Store current polygon coordinates
-                        if lev not in multipolygon_coordinates:
-                            multipolygon_coordinates[lev] = list()
-                        multipolygon_coordinates[lev].append([coordinates])
-                        # Store current polygon properties
-                        properties = {
-                            "fillColor": colors[lev],
-                            "fillOpacity": 1
-                        }
-                        if lev not in multipolygon_properties:
-                            multipolygon_properties[lev] = properties
-                        else:
-                            assert multipolygon_properties[lev] == properties
+                    # Polygons are closed only after transformation, hence they need at least two points here
+                    if len(curve) > 1:
+                        curves.append(curve)
+                        curves_levels.append(lev)
 
             multipolygon_features = list()
-            for lev in multipolygon_coordinates.keys():
-                multipolygon = geojson.MultiPolygon(coordinates=multipolygon_coordinates[lev])
-                feature = geojson.Feature(
-                    geometry=multipolygon,
-                    properties=multipolygon_properties[lev]
-                )
-                multipolygon_features.append(feature)
-
-            return geojson.FeatureCollection(multipolygon_features)
+            for (lev, level_curves) in self._transform_curves_by_level(curves, curves_levels, closed=True):
+                multipolygon_features.append({
+                    "type": "Feature",
+                    "geometry": {"type": "MultiPolygon", "coordinates": [[curve] for curve in level_curves]},
+                    "properties": {
+                        # Boundary properties
+                        "stroke": False,
+                        # Interior properties
+                        "fillColor": colors[lev],
+                        "fillOpacity": 1
+                    }
+                })
+
+            return {"type": "FeatureCollection", "features": multipolygon_features}
         else:  # pragma: no cover
             raise ValueError("Invalid mode")
 
+    def _transform_curves_by_level(
+        self, curves: list[np.typing.NDArray[np.float64]], curves_levels: list[int], closed: bool = False
+    ) -> list[tuple[int, list[list[list[float]]]]]:
+        """
+        Transform the coordinates of several curves at once, and group them by level.
+
+        Parameters
+        ----------
+        curves
+            List of matrices, each one containing the coordinates of the points of a curve.
+        curves_levels
+            Index of the level associated to each curve. Curves associated to the same level
+            are expected to be contiguous in the list.
+        closed
+            If True, each curve is closed by repeating its first point at the end.
+
+        Returns
+        -------
+        :
+            A list of pairs, containing the index of a level and the list of transformed coordinates of its curves.
+        """
+        if len(curves) == 0:
+            return []
+        # Convert all points to nested lists with a single call, so that the coordinates of each curve
+        # are a slice of the converted list
+        curves_offsets = np.cumsum([0, *[len(curve) for curve in curves]]).tolist()
+        points = np.concatenate(curves)
+        if self.transform_first:
+            # Curves have been computed on the transformed mesh, hence they only need to be rounded
+            transformed_points = np.round(points, 6).tolist()
+        else:
+            transformed_points = self._transform_coordinates(points).tolist()
+        transformed_curves = [
+            transformed_points[begin:end] for (begin, end) in zip(curves_offsets[:-1], curves_offsets[1:])]
+        if closed:
+            for curve in transformed_curves:
+                curve.append(curve[0])
+        levels_offsets = np.flatnonzero(np.diff(curves_levels) != 0) + 1
+        return [
+            (curves_levels[begin], transformed_curves[begin:end])
+            for (begin, end) in zip([0, *levels_offsets.tolist()], [*levels_offsets.tolist(), len(curves)])]
+
+    def _create_contour_generator(
+        self, vertices: np.typing.NDArray[np.float64], cells: np.typing.NDArray[np.int64],
+        scalar_field: np.typing.NDArray[np.float64]
+    ) -> matplotlib._tri.TriContourGenerator:
+        """
+        Create a matplotlib contour generator on a triangular mesh.
+
+        Parameters
+        ----------
+        vertices
+            Matrix containing the coordinates of the vertices.
+            The matrix should have as many rows as vertices in the mesh, and two columns.
+        cells
+            Matrix containing the connectivity of the cells.
+            The matrix should have as many rows as cells in the mesh, and three columns.
+        scalar_field
+            Vector containing the value of the field at each vertex.
+            The vector should have as many entries as vertices in the mesh.
+
+        Returns
+        -------
+        :
+            A contour generator, to be passed to _create_contour or _create_filled_contour.
+        """
+        if self._triangulation_cache is not None and (
+            self._triangulation_cache[0].shape == vertices.shape
+            and self._triangulation_cache[1].shape == cells.shape
+            and np.array_equal(self._triangulation_cache[0], vertices)
+            and np.array_equal(self._triangulation_cache[1], cells)
+        ):
+            cpp_triangulation = self._triangulation_cache[2]
+        else:
+            # The triangular tracer of matplotlib is used directly, since contourpy (which provides the serial
+            # and threaded algorithms used by matplotlib for quadrilateral grids) does not support unstructured
+            # triangulations
+            tri = mpl.tri.Triangulation(vertices[:, 0], vertices[:, 1], cells)
+            cpp_triangulation = tri.get_cpp_triangulation()
+            # Store copies of the mesh arrays, so that the cache is not affected by later changes to the inputs
+            self._triangulation_cache = (np.array(vertices), np.array(cells), cpp_triangulation)
+        return mpl._tri.TriContourGenerator(cpp_triangulation, scalar_field)
+
+    @staticmethod
+    def _create_contour(
+        contour_generator: matplotlib._tri.TriContourGenerator, level: float
+    ) -> list[np.typing.NDArray[np.float64]]:
+        """
+        Compute the contour lines associated to a level, independently of the matplotlib version.
+
+        Parameters
+        ----------
+        contour_generator
+            Contour generator returned by _create_contour_generator.
+        level
+            Value of the contour lines.
+
+        Returns
+        -------
+        :
+            A list of matrices, each one containing the coordinates of the points of a contour line.
+        """
+        curves = contour_generator.create_contour(level)
+        if isinstance(curves, tuple):  # non backward compatible change in matplotlib commit 178012
+            assert len(curves) == 2
+            curves = curves[0]
+        assert isinstance(curves, list)
+        return curves
+
+    @staticmethod
+    def _create_filled_contour(
+        contour_generator: matplotlib._tri.TriContourGenerator, lower_level: float, upper_level: float
+    ) -> tuple[np.typing.NDArray[np.float64], np.typing.NDArray[np.uint8]]:
+        """
+        Compute the filled contour between two levels, independently of the matplotlib version.
+
+        Parameters
+        ----------
+        contour_generator
+            Contour generator returned by _create_contour_generator.
+        lower_level, upper_level
+            Values of the contour lines delimiting the filled region.
+
+        Returns
+        -------
+        :
+            A pair containing the matrix of the coordinates of the points of all polygons, and the vector
+            of the corresponding matplotlib path codes. A code equal to one marks the first point of a polygon.
+        """
+        filled_contour = contour_generator.create_filled_contour(lower_level, upper_level)
+        assert len(filled_contour) == 2
+        if isinstance(filled_contour[0], list):  # non backward compatible change in matplotlib commit 178012
+            assert isinstance(filled_contour[1], list)
+            assert len(filled_contour[0]) == 1
+            assert len(filled_contour[1]) == 1
+            filled_contour = (np.array(filled_contour[0][0]), np.array(filled_contour[1][0]))
+        assert len(filled_contour[0].shape) == 2
+        assert len(filled_contour[1].shape) == 1
+        return filled_contour
+
     def add_vector_field_to(
         self, geo_map: folium.Map, vertices: np.typing.NDArray[np.float64], cells: np.typing.NDArray[np.int64],
         vector_field: np.typing.NDArray[np.float64], mode: typing.Optional[str] = None,
-        levels: typing.Optional[typing.Union[int, list[float]]] = None, scale: typing.Optional[float] = None,
-        cmap: typing.Optional[str] = None, name: typing.Optional[str] = None
+        levels: typing.Optional[typing.Union[int, list[float], np.typing.NDArray[np.float64]]] = None,
+        scale: typing.Optional[float] = None, cmap: typing.Optional[str] = None, name: typing.Optional[str] = None
     ) -> None:
         """
         Add a vector field to a folium map.
@@ -260,7 +455,7 @@ class BaseSolutionPlotter(BasePlotter):
             In quiver mode: number of ticks to be added to the color bar.
             If integer, it will determine the number of equispaced values to be used between
             the minimum and maximum entry of the scalar field.
-            If list, it will determine the values to be used.
+            If list or numpy array, it will determine the values to be used.
             If not provided, 10 levels are used by default.
         scale
             This is only applicable for quiver mode: scaling to be applied before drawing arrows.
@@ -276,46 +471,23 @@ class BaseSolutionPlotter(BasePlotter):
             mode = "contourf"
         assert mode in ("contourf", "contour", "quiver")
 
-        vector_field_magnitude = np.linalg.norm(vector_field, axis=1)
+        assert len(vector_field.shape) == 2 and vector_field.shape[1] == 2
+        vector_field_magnitude = np.hypot(vector_field[:, 0], vector_field[:, 1])
 
-        if levels is None:
-            levels = 10
-        assert isinstance(levels, (int, list, np.ndarray))
-        if isinstance(levels, int):
-            levels = np.linspace(vector_field_magnitude.min(), vector_field_magnitude.max(), levels)
-        elif isinstance(levels, list):
-            levels = np.array(levels)
-        elif isinstance(levels, np.ndarray):
-            pass
-        else:  # pragma: no cover
-            raise ValueError("Invalid levels")
-
-        if cmap is None:
-            cmap = "jet"
-        if isinstance(cmap, str):
-            cmap = plt.get_cmap(cmap, lut=levels.shape[0])
-        cnorm = plt.Normalize(vmin=levels[0], vmax=levels[-1])
+        levels, cmap, cnorm = self._process_levels_and_cmap(vector_field_magnitude, levels, cmap)
 
         if name is None:
             name = "Vector field"
 
         if mode in ("contourf", "contour"):
-            return BaseSolutionPlotter.add_scalar_field_to(
-                self, geo_map, vertices, cells, vector_field_magnitude, mode, levels, cmap, name)
+            self._add_contours_to(geo_map, vertices, cells, vector_field_magnitude, mode, levels, cmap, cnorm, name)
         elif mode == "quiver":
             json = self._convert_vector_field_to_geojson(
-                vertices, vector_field_magnitude, vector_field, scale,
-                lambda lev: mpl.colors.to_hex(cmap(cnorm(lev))))
-
-            def style_function(x: dict[str, dict[str, typing.Any]]) -> dict[str, typing.Any]:
-                return {
-                    "color": x["properties"]["color"],
-                    "weight": x["properties"]["weight"]
-                }
-
-            GeoJsonWithArrows(json, style_function=style_function, frequency="endonly").add_to(geo_map)
+                vertices, vector_field_magnitude, vector_field, scale, cmap, cnorm)
+            GeoJsonWithArrows(
+                json, style_function=self._properties_style_function, frequency="endonly").add_to(geo_map)
 
-            colors = [mpl.colors.to_hex(cmap(cnorm(lev))) for lev in levels]
+            colors = self._colormap_hex_table(cmap)[self._colormap_indices(cmap, cnorm(levels))].tolist()
             colorbar = ColorbarWrapper(colors=colors, values=levels, caption=name)
             colorbar.add_to(geo_map)
         else:  # pragma: no cover
@@ -323,8 +495,9 @@ class BaseSolutionPlotter(BasePlotter):
 
     def _convert_vector_field_to_geojson(
         self, vertices: np.typing.NDArray[np.float64], vector_field_magnitude: np.typing.NDArray[np.float64],
-        vector_field: np.typing.NDArray[np.float64], scale: float, cmap: typing.Callable[[float], str]
-    ) -> geojson.FeatureCollection:
+        vector_field: np.typing.NDArray[np.float64], scale: float, cmap: mpl.colors.Colormap,
+        cnorm: mpl.colors.Normalize
+    ) -> dict[str, typing.Any]:
         """
         Convert a scalar field to a geojson FeatureCollection.
 
@@ -345,40 +518,156 @@ class BaseSolutionPlotter(BasePlotter):
             Scaling to be applied before drawing arrows.
         cmap
             Color map to be used.
+        cnorm
+            Normalization of the magnitude to be applied before evaluating the color map.
 
         Returns
         -------
         :
             A geojson FeatureCollection representing the scalar field.
         """
-        multiline_coordinates = dict()
-        multiline_properties = dict()
-        for v in range(vertices.shape[0]):
-            coordinates = [
-                self.transformer(*vertices[v, :]),
-                self.transformer(*(vertices[v, :] + scale * vector_field[v, :]))]
-            color = cmap(vector_field_magnitude[v])
-            # Store current coordinates
-            if color not in multiline_coordinates:
-                multiline_coordinates[color] = list()
-            multiline_coordinates[color].append(coordinates)
-            # Store current properties
-            properties = {
-                "color": color,
-                "weight": 2
-            }
-            if color not in multiline_properties:
-                multiline_properties[color] = properties
-            else:
-                assert multiline_properties[color] == properties
+        # Arrows start from the mesh vertices, whose transformation may be reused from previous plots,
+        # while all arrow ends are transformed with a single call to the transformer
+        arrows_coordinates = np.stack(
+            (self._transform_vertices(vertices), self._transform_coordinates(vertices + scale * vector_field)), axis=1)
+        # Bucket all magnitudes by their entry in the lookup table of the color map, and then read their color
+        # from the hex table of the color map. Since different entries may be rounded to the same hex color,
+        # arrows are finally grouped by hex color.
+        lut_indices = self._colormap_indices(cmap, cnorm(vector_field_magnitude))
+        unique_colors, unique_colors_ids = np.unique(self._colormap_hex_table(cmap), return_inverse=True)
+        colors_ids = unique_colors_ids[lut_indices]
+
+        # Convert all arrows to nested lists with a single call, after sorting them by group, so that
+        # the coordinates of each feature are a slice of the converted list
+        groups = self._group_by_first_occurrence(colors_ids)
+        if len(groups) == 0:
+            return {"type": "FeatureCollection", "features": []}
+        sorted_arrows_coordinates = arrows_coordinates[np.concatenate(groups)].tolist()
+        groups_offsets = np.cumsum([0, *[group.shape[0] for group in groups]]).tolist()
 
         multiline_features = list()
-        for color in multiline_coordinates.keys():
-            multiline = geojson.MultiLineString(coordinates=multiline_coordinates[color])
-            feature = geojson.Feature(
-                geometry=multiline,
-                properties=multiline_properties[color]
-            )
-            multiline_features.append(feature)
-
-        return geojson.FeatureCollection(multiline_features)
+        for (group, begin, end) in zip(groups, groups_offsets[:-1], groups_offsets[1:]):
+            multiline_features.append({
+                "type": "Feature",
+                "geometry": {"type": "MultiLineString", "coordinates": sorted_arrows_coordinates[begin:end]},
+                "properties": {
+                    "color": str(unique_colors[colors_ids[group[0]]]),
+                    "weight": 2
+                }
+            })
+
+        return {"type": "FeatureCollection", "features": multiline_features}
+
+    @staticmethod
+    def _properties_style_function(x: dict[str, dict[str, typing.Any]]) -> dict[str, typing.Any]:
+        """
+        Style a feature generated by this class.
+
+        Properties of the features are already stored with the names of the corresponding leaflet path options,
+        hence the style is simply given by the properties themselves.
+        """
+        return x["properties"]
+
+    @staticmethod
+    def _colormap_indices(
+        cmap: mpl.colors.Colormap, values: np.typing.NDArray[np.float64]
+    ) -> np.typing.NDArray[np.int64]:
+        """
+        Compute the entries of the lookup table of a color map associated to several normalized values.
+
+        Entries are computed following the same rules of matplotlib.colors.Colormap.__call__, so that
+        evaluating the color map on the returned integer indices by means of _colormap_colors gives
+        the same colors as evaluating it on the normalized values.
+
+        Parameters
+        ----------
+        cmap
+            Color map to be used.
+        values
+            Vector containing normalized values, i.e. values in [0, 1] for colors within the range of the color map.
+
+        Returns
+        -------
+        :
+            Vector containing the index of the entry of the lookup table associated to each value.
+            Values under the range are associated to -1, values over the range to cmap.N,
+            and invalid values to cmap.N + 1.
+        """
+        scaled_values = np.array(values, dtype=np.float64) * cmap.N
+        # A normalized value equal to one is not out of range
+        scaled_values[scaled_values == cmap.N] = cmap.N - 1
+        mask_under = scaled_values < 0
+        mask_over = scaled_values >= cmap.N
+        mask_bad = np.isnan(scaled_values)
+        with np.errstate(invalid="ignore"):
+            indices = scaled_values.astype(np.int64)
+        indices[mask_under] = -1
+        indices[mask_over] = cmap.N
+        indices[mask_bad] = cmap.N + 1
+        return indices
+
+    @staticmethod
+    def _colormap_colors(
+        cmap: mpl.colors.Colormap, indices: np.typing.NDArray[np.int64]
+    ) -> np.typing.NDArray[np.float64]:
+        """
+        Evaluate a color map on the indices returned by _colormap_indices.
+
+        Parameters
+        ----------
+        cmap
+            Color map to be used.
+        indices
+            Vector containing the index of the entry of the lookup table.
+
+        Returns
+        -------
+        :
+            Matrix containing the RGBA color associated to each index.
+        """
+        # Integer inputs to matplotlib color maps are directly used as indices in the lookup table,
+        # with negative integers representing values under the range and integers greater than or equal
+        # to cmap.N representing values over the range
+        rgba = cmap(np.minimum(indices, cmap.N))
+        rgba[indices == cmap.N + 1] = cmap(np.nan)
+        return rgba
+
+    @staticmethod
+    def _colormap_hex_table(cmap: mpl.colors.Colormap) -> np.typing.NDArray[np.str_]:
+        """
+        Convert the whole lookup table of a color map to hex strings.
+
+        Parameters
+        ----------
+        cmap
+            Color map to be used.
+
+        Returns
+        -------
+        :
+            Vector containing the hex color of each index returned by _colormap_indices. Entries from 0 to cmap.N + 1
+            are stored at the corresponding position, while the color for values under the range is stored
+            as last entry, so that the vector can be directly indexed by the output of _colormap_indices.
+        """
+        indices = np.array([*range(cmap.N + 2), -1], dtype=np.int64)
+        return np.array(BaseSolutionPlotter._rgba_to_hex(BaseSolutionPlotter._colormap_colors(cmap, indices)))
+
+    @staticmethod
+    def _rgba_to_hex(rgba: np.typing.NDArray[np.float64]) -> list[str]:
+        """
+        Convert several RGBA colors to hex strings at once.
+
+        Parameters
+        ----------
+        rgba
+            Matrix containing a color in each row, with four columns for red, green, blue and alpha
+            components in [0, 1].
+
+        Returns
+        -------
+        :
+            A list of hex strings, discarding the alpha component as in matplotlib.colors.to_hex.
+        """
+        # Components are rounded to the nearest integer as in matplotlib.colors.to_hex
+        rgb = np.round(np.asarray(rgba)[:, :3] * 255).astype(np.int64)
+        return [f"#{r:02x}{g:02x}{b:02x}" for (r, g, b) in rgb.tolist()]
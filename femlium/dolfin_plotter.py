@@ -10,10 +10,17 @@ import typing
 import dolfin
 import folium
 import numpy as np
+import numpy.typing
 
 from femlium.base_mesh_plotter import BaseMeshPlotter
 from femlium.base_solution_plotter import BaseSolutionPlotter
 
+# The local face to vertex connectivity in FIAT is
+# 0: (1, 2), 1: (0, 2), 2: (0, 1)
+# while in FEMlium we assume
+# 0: (0, 1), 1: (1, 2), 2: (0, 2)
+_FIAT_TO_FEMLIUM = np.array([1, 2, 0], dtype=np.int64)
+
 
 class DolfinPlotter(BaseMeshPlotter, BaseSolutionPlotter):
     """Interface of a geographic plotter for dolfin meshes and solutions."""
@@ -70,16 +77,12 @@ class DolfinPlotter(BaseMeshPlotter, BaseSolutionPlotter):
             mesh.init(2, 1)
             cell_to_faces_connectivity = mesh.topology()(2, 1)
 
-            # The local face to vertex connectivity in FIAT is
-            # 0: (1, 2), 1: (0, 2), 2: (0, 1)
-            # while in FEMlium we assume
-            # 0: (0, 1), 1: (1, 2), 2: (0, 2)
-            fiat_to_femlium = {0: 1, 1: 2, 2: 0}
-
-            face_markers = np.zeros(cells.shape, dtype=np.int64)
-            for c in range(cells.shape[0]):
-                for (f, global_face_number) in enumerate(cell_to_faces_connectivity(c)):
-                    face_markers[c, fiat_to_femlium[f]] = face_mesh_function[global_face_number]
+            # Each triangular cell has exactly three faces, hence the flattened connectivity can be
+            # reshaped to a matrix and face markers can be read at once for all cells
+            cell_to_faces = np.asarray(cell_to_faces_connectivity(), dtype=np.int64).reshape(cells.shape[0], 3)
+            # Every entry is assigned by the gather below, hence there is no need to initialize the matrix
+            face_markers = np.empty(cells.shape, dtype=np.int64)
+            face_markers[:, _FIAT_TO_FEMLIUM] = face_mesh_function.array()[cell_to_faces]
         else:
             face_markers = None
 
@@ -88,7 +91,7 @@ class DolfinPlotter(BaseMeshPlotter, BaseSolutionPlotter):
 
     def add_scalar_field_to(
         self, geo_map: folium.Map, scalar_field: dolfin.Function, mode: typing.Optional[str] = None,
-        levels: typing.Optional[typing.Union[int, list[float]]] = None,
+        levels: typing.Optional[typing.Union[int, list[float], np.typing.NDArray[np.float64]]] = None,
         cmap: typing.Optional[str] = None, name: typing.Optional[str] = None
     ) -> None:
         """
@@ -107,7 +110,7 @@ class DolfinPlotter(BaseMeshPlotter, BaseSolutionPlotter):
             Values of the contour lines.
             If integer, it will determine the number of equispaced values to be used between
             the minimum and maximum entry of the scalar field.
-            If list, it will determine the values to be used.
+            If list or numpy array, it will determine the values to be used.
             If not provided, 10 levels are used by default.
         cmap
             matplotlib color map to be used.
@@ -126,8 +129,8 @@ class DolfinPlotter(BaseMeshPlotter, BaseSolutionPlotter):
 
     def add_vector_field_to(
         self, geo_map: folium.Map, vector_field: dolfin.Function, mode: typing.Optional[str] = None,
-        levels: typing.Optional[typing.Union[int, list[float]]] = None, scale: typing.Optional[float] = None,
-        cmap: typing.Optional[str] = None, name: typing.Optional[str] = None
+        levels: typing.Optional[typing.Union[int, list[float], np.typing.NDArray[np.float64]]] = None,
+        scale: typing.Optional[float] = None, cmap: typing.Optional[str] = None, name: typing.Optional[str] = None
     ) -> None:
         """
         Add a vector field to a folium map.
@@ -146,7 +149,7 @@ class DolfinPlotter(BaseMeshPlotter, BaseSolutionPlotter):
             In quiver mode: number of ticks to be added to the color bar.
             If integer, it will determine the number of equispaced values to be used between
             the minimum and maximum entry of the scalar field.
-            If list, it will determine the values to be used.
+            If list or numpy array, it will determine the values to be used.
             If not provided, 10 levels are used by default.
         scale
             This is only applicable for quiver mode: scaling to be applied before drawing arrows.
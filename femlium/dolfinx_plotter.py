@@ -10,18 +10,34 @@ import typing
 import dolfinx.cpp
 import dolfinx.fem
 import dolfinx.mesh
-import dolfinx.plot
 import folium
 import numpy as np
 import numpy.typing
+import pyproj
 
 from femlium.base_mesh_plotter import BaseMeshPlotter
 from femlium.base_solution_plotter import BaseSolutionPlotter
 
+# The local face to vertex connectivity in basix is
+# 0: (1, 2), 1: (0, 2), 2: (0, 1)
+# while in FEMlium we assume
+# 0: (0, 1), 1: (1, 2), 2: (0, 2)
+_BASIX_TO_FEMLIUM = np.array([1, 2, 0], dtype=np.int64)
+
 
 class DolfinxPlotter(BaseMeshPlotter, BaseSolutionPlotter):
     """Interface of a geographic plotter for dolfinx meshes and solutions."""
 
+    def __init__(
+        self, transformer: typing.Optional[pyproj.Transformer] = None, transform_first: bool = False
+    ) -> None:
+        super().__init__(transformer, transform_first)
+        # Cache of the linear function spaces used to plot fields, and of their vertices and cells, indexed by
+        # the value shape of the space, since several fields are often plotted on the same mesh
+        self._linear_function_spaces_cache: dict[tuple[int, ...], tuple[
+            dolfinx.mesh.Mesh, dolfinx.fem.FunctionSpace,
+            np.typing.NDArray[np.float64], np.typing.NDArray[np.int64]]] = dict()
+
     def add_mesh_to(
         self, geo_map: folium.Map, mesh: dolfinx.mesh.Mesh,
         cell_mesh_tags: typing.Optional[dolfinx.cpp.mesh.MeshTags_int32] = None,
@@ -77,37 +93,36 @@ class DolfinxPlotter(BaseMeshPlotter, BaseSolutionPlotter):
         if unmarked_face_marker is None:
             unmarked_face_marker = 0
 
-        vertices = mesh.geometry.x[:, :mesh.topology.dim]
+        # Copy the coordinates to a contiguous matrix once, rather than passing a strided view of the
+        # three dimensional coordinates to every later operation
+        vertices = np.ascontiguousarray(mesh.geometry.x[:, :mesh.topology.dim])
         cells = mesh.geometry.dofmap
 
         if cell_mesh_tags is not None:
-            cell_markers = np.full((cells.shape[0], ), unmarked_cell_marker, dtype=np.int64)
+            # Keep the integer type of the mesh tags, which is narrower than the default integer type
+            cell_markers = np.full((cells.shape[0], ), unmarked_cell_marker, dtype=cell_mesh_tags.values.dtype)
             cell_markers[cell_mesh_tags.indices] = cell_mesh_tags.values
         else:
             cell_markers = None
 
         if face_mesh_tags is not None:
-            mesh.topology.create_connectivity(mesh.topology.dim - 1, mesh.topology.dim)
-            mesh.topology.create_connectivity(mesh.topology.dim, mesh.topology.dim - 1)
-            face_to_cells_connectivity = mesh.topology.connectivity(mesh.topology.dim - 1, mesh.topology.dim)
             cell_to_faces_connectivity = mesh.topology.connectivity(mesh.topology.dim, mesh.topology.dim - 1)
+            if cell_to_faces_connectivity is None:
+                # The connectivity is computed only if not already available from previous calls
+                mesh.topology.create_connectivity(mesh.topology.dim, mesh.topology.dim - 1)
+                cell_to_faces_connectivity = mesh.topology.connectivity(mesh.topology.dim, mesh.topology.dim - 1)
+            faces_index_map = mesh.topology.index_map(mesh.topology.dim - 1)
 
-            # The local face to vertex connectivity in basix is
-            # 0: (1, 2), 1: (0, 2), 2: (0, 1)
-            # while in FEMlium we assume
-            # 0: (0, 1), 1: (1, 2), 2: (0, 2)
-            basix_to_femlium = {0: 1, 1: 2, 2: 0}
-
-            face_markers = np.full(cells.shape, unmarked_face_marker, dtype=np.int64)
-            for (global_face_number, face_mesh_tag) in zip(face_mesh_tags.indices, face_mesh_tags.values):
-                cells_ = face_to_cells_connectivity.links(global_face_number)
-                basix_face_numbers = np.array([
-                    np.argwhere(cell_to_faces_connectivity.links(c) == global_face_number)[0] for c in cells_])
-                assert basix_face_numbers.shape == (cells_.shape[0], 1)
-                femlium_face_numbers = [
-                    basix_to_femlium[basix_face_number] for basix_face_number in basix_face_numbers.reshape(-1)]
-                for (cell, femlium_face_number) in zip(cells_, femlium_face_numbers):
-                    face_markers[cell, femlium_face_number] = face_mesh_tag
+            # Store the marker of every face, and then read face markers at once for all cells: since
+            # each triangular cell has exactly three faces, the cell to face connectivity is reshaped to a matrix
+            all_face_markers = np.full(
+                faces_index_map.size_local + faces_index_map.num_ghosts, unmarked_face_marker,
+                dtype=face_mesh_tags.values.dtype)
+            all_face_markers[face_mesh_tags.indices] = face_mesh_tags.values
+            cell_to_faces = cell_to_faces_connectivity.array.reshape(-1, 3)
+            # Every entry is assigned by the gather below, hence there is no need to initialize the matrix
+            face_markers = np.empty(cells.shape, dtype=all_face_markers.dtype)
+            face_markers[:, _BASIX_TO_FEMLIUM] = all_face_markers[cell_to_faces]
         else:
             face_markers = None
 
@@ -116,7 +131,7 @@ class DolfinxPlotter(BaseMeshPlotter, BaseSolutionPlotter):
 
     def add_scalar_field_to(
         self, geo_map: folium.Map, scalar_field: dolfinx.fem.Function, mode: typing.Optional[str] = None,
-        levels: typing.Optional[typing.Union[int, list[float]]] = None,
+        levels: typing.Optional[typing.Union[int, list[float], np.typing.NDArray[np.float64]]] = None,
         cmap: typing.Optional[str] = None, name: typing.Optional[str] = None
     ) -> None:
         """
@@ -135,7 +150,7 @@ class DolfinxPlotter(BaseMeshPlotter, BaseSolutionPlotter):
             Values of the contour lines.
             If integer, it will determine the number of equispaced values to be used between
             the minimum and maximum entry of the scalar field.
-            If list, it will determine the values to be used.
+            If list or numpy array, it will determine the values to be used.
             If not provided, 10 levels are used by default.
         cmap
             matplotlib color map to be used.
@@ -144,18 +159,14 @@ class DolfinxPlotter(BaseMeshPlotter, BaseSolutionPlotter):
             Name of the field, to be used in the creation of the color bar.
             If not provided, the name "scalar field" will be used.
         """
-        scalar_function_space_p1 = dolfinx.fem.functionspace(scalar_field.function_space.mesh, ("CG", 1))
-        vertices, cells = self._get_vertices_cells_of_linear_function_space(scalar_function_space_p1)
-        scalar_field_p1 = dolfinx.fem.Function(scalar_function_space_p1)
-        scalar_field_p1.interpolate(scalar_field)
-        scalar_field_values = scalar_field_p1.x.array
+        vertices, cells, scalar_field_values = self._get_values_on_linear_function_space(scalar_field, ())
         return BaseSolutionPlotter.add_scalar_field_to(
             self, geo_map, vertices, cells, scalar_field_values, mode, levels, cmap, name)
 
     def add_vector_field_to(
         self, geo_map: folium.Map, vector_field: dolfinx.fem.Function, mode: typing.Optional[str] = None,
-        levels: typing.Optional[typing.Union[int, list[float]]] = None, scale: typing.Optional[float] = None,
-        cmap: typing.Optional[str] = None, name: typing.Optional[str] = None
+        levels: typing.Optional[typing.Union[int, list[float], np.typing.NDArray[np.float64]]] = None,
+        scale: typing.Optional[float] = None, cmap: typing.Optional[str] = None, name: typing.Optional[str] = None
     ) -> None:
         """
         Add a vector field to a folium map.
@@ -174,7 +185,7 @@ class DolfinxPlotter(BaseMeshPlotter, BaseSolutionPlotter):
             In quiver mode: number of ticks to be added to the color bar.
             If integer, it will determine the number of equispaced values to be used between
             the minimum and maximum entry of the scalar field.
-            If list, it will determine the values to be used.
+            If list or numpy array, it will determine the values to be used.
             If not provided, 10 levels are used by default.
         scale
             This is only applicable for quiver mode: scaling to be applied before drawing arrows.
@@ -186,21 +197,72 @@ class DolfinxPlotter(BaseMeshPlotter, BaseSolutionPlotter):
             Name of the field, to be used in the creation of the color bar.
             If not provided, the name "vector field" will be used.
         """
-        mesh = vector_field.function_space.mesh
-        vector_function_space_p1 = dolfinx.fem.functionspace(mesh, ("CG", 1, (mesh.geometry.dim, )))
-        vertices, cells = self._get_vertices_cells_of_linear_function_space(vector_function_space_p1)
-        vector_field_p1 = dolfinx.fem.Function(vector_function_space_p1)
-        vector_field_p1.interpolate(vector_field)
-        vector_field_values = vector_field_p1.x.array.reshape(
-            vertices.shape[0], vector_function_space_p1.dofmap.index_map_bs)
+        vertices, cells, vector_field_values = self._get_values_on_linear_function_space(
+            vector_field, (vector_field.function_space.mesh.geometry.dim, ))
         return BaseSolutionPlotter.add_vector_field_to(
             self, geo_map, vertices, cells, vector_field_values, mode, levels, scale, cmap, name)
 
+    def _get_values_on_linear_function_space(
+        self, field: dolfinx.fem.Function, value_shape: tuple[int, ...]
+    ) -> tuple[np.typing.NDArray[np.float64], np.typing.NDArray[np.int64], np.typing.NDArray[np.float64]]:
+        """Get vertices, cells and values of a field on the linear function space, interpolating only if needed."""
+        function_space = field.function_space
+        mesh = function_space.mesh
+        function_space_p1, vertices, cells = self._get_linear_function_space(mesh, value_shape)
+        if function_space is function_space_p1:
+            values = field.x.array
+        elif (
+            len(function_space.component()) == 0 and function_space.ufl_element() == function_space_p1.ufl_element()
+        ):
+            # The field is already linear: its values are used directly, on the vertices and cells of its own
+            # function space, which is stored in the cache in place of the one created by this class.
+            # Subspaces (e.g., components of a mixed function) are excluded, since their values are stored
+            # in the vector of the parent function and must be interpolated
+            vertices, cells = self._get_vertices_cells_of_linear_function_space(function_space)
+            self._linear_function_spaces_cache[value_shape] = (mesh, function_space, vertices, cells)
+            values = field.x.array
+        else:
+            field_p1 = dolfinx.fem.Function(function_space_p1)
+            field_p1.interpolate(field)
+            values = field_p1.x.array
+        if value_shape == ():
+            return vertices, cells, values
+        else:
+            return vertices, cells, values.reshape(vertices.shape[0], function_space_p1.dofmap.index_map_bs)
+
+    def _get_linear_function_space(
+        self, mesh: dolfinx.mesh.Mesh, value_shape: tuple[int, ...]
+    ) -> tuple[dolfinx.fem.FunctionSpace, np.typing.NDArray[np.float64], np.typing.NDArray[np.int64]]:
+        """Get the linear function space on a mesh, and its vertices and cells, reusing them if already created."""
+        if value_shape in self._linear_function_spaces_cache:
+            (cached_mesh, function_space, vertices, cells) = self._linear_function_spaces_cache[value_shape]
+            if cached_mesh is mesh:
+                return function_space, vertices, cells
+        if value_shape == ():
+            function_space = dolfinx.fem.functionspace(mesh, ("CG", 1))
+        else:
+            function_space = dolfinx.fem.functionspace(mesh, ("CG", 1, value_shape))
+        vertices, cells = self._get_vertices_cells_of_linear_function_space(function_space)
+        # Store the mesh itself rather than its id, so that the cached entry cannot be matched by a different mesh
+        # created at the same memory address after the original one has been garbage collected
+        self._linear_function_spaces_cache[value_shape] = (mesh, function_space, vertices, cells)
+        return function_space, vertices, cells
+
     def _get_vertices_cells_of_linear_function_space(
         self, function_space: dolfinx.fem.FunctionSpace
     ) -> tuple[np.typing.NDArray[np.float64], np.typing.NDArray[np.int64]]:
-        """Postprocess the output of dolfinx.plot.vtk_mesh and return vertices and cells for matplotlib."""
-        cells, _, vertices = dolfinx.plot.vtk_mesh(function_space)
-        cells = cells.reshape((-1, 4))
-        assert np.all(cells[:, 0] == 3)  # first colum contains the number of vertices of a triangular cell
-        return vertices[:, :function_space.mesh.topology.dim], cells[:, 1:]
+        """
+        Return vertices and cells of a linear function space for matplotlib.
+
+        On a linear function space the dofmap is the cell to vertex connectivity, with the same local ordering
+        of the vertices of a triangle as in matplotlib, and the dof coordinates are the vertices. This avoids
+        the construction of the VTK topology in dolfinx.plot.vtk_mesh, which would only be unpacked here.
+        As in dolfinx.plot.vtk_mesh, ghost cells are excluded, so that they are not plotted by several processes.
+        """
+        mesh = function_space.mesh
+        vertices = function_space.tabulate_dof_coordinates()
+        cells = function_space.dofmap.list[:mesh.topology.index_map(mesh.topology.dim).size_local]
+        assert cells.shape[1] == 3
+        return (
+            np.ascontiguousarray(vertices[:, :mesh.topology.dim]),
+            np.ascontiguousarray(cells, dtype=np.int64))
@@ -5,10 +5,10 @@
 # SPDX-License-Identifier: MIT
 """Geographic plotter for the computational domain."""
 
+import collections
 import typing
 
 import folium
-import geojson
 import numpy as np
 import numpy.typing
 
@@ -74,8 +74,9 @@ class DomainPlotter(BasePlotter):
 
         colors_values = np.arange(0, np.max(unique_markers) + 1)
         assert colors.shape == colors_values.shape
-        colors_in_figure = np.delete(colors, np.setdiff1d(colors_values, unique_markers))
-        colors_values_in_figure = np.delete(colors_values, np.setdiff1d(colors_values, unique_markers))
+        colors_in_figure_mask = np.isin(colors_values, unique_markers)
+        colors_in_figure = colors[colors_in_figure_mask]
+        colors_values_in_figure = colors_values[colors_in_figure_mask]
         if np.unique(colors_in_figure).shape[0] > 1:
             colorbar = ColorbarWrapper(
                 colors=colors_in_figure, values=colors_values_in_figure, caption="Segment markers")
@@ -84,7 +85,7 @@ class DomainPlotter(BasePlotter):
     def _convert_domain_to_geojson(
         self, vertices: np.typing.NDArray[np.float64], segment_markers: np.typing.NDArray[np.int64],
         colors: typing.Union[str, dict[int, str]], weights: typing.Union[int, dict[int, int]]
-    ) -> geojson.FeatureCollection:
+    ) -> dict[str, typing.Any]:
         """
         Convert a domain to a geojson FeatureCollection.
 
@@ -109,43 +110,27 @@ class DomainPlotter(BasePlotter):
         :
             A geojson FeatureCollection representing the domain.
         """
-        multiline_coordinates = dict()
-        multiline_properties = dict()
-        previous_marker = segment_markers[0]
-        previous_coordinates = np.array(self.transformer(*vertices[0, :]))
-        finalize_placeholder = "finalize"
-        for v in range(vertices.shape[0]):
-            if v < vertices.shape[0] - 1:
-                next_vertex = self.transformer(*vertices[v + 1, :])
-                current_marker = segment_markers[v]
-            else:
-                current_marker = finalize_placeholder
-            if current_marker != previous_marker:
-                # Store previous line
-                if previous_marker not in multiline_coordinates:
-                    multiline_coordinates[previous_marker] = list()
-                multiline_coordinates[previous_marker].append(previous_coordinates.tolist())
-                # Store properties of the previous line
-                previous_properties = {
-                    "color": colors[previous_marker],
-                    "weight": int(weights[previous_marker])
-                }
-                if previous_marker not in multiline_properties:
-                    multiline_properties[previous_marker] = previous_properties
-                else:
-                    assert multiline_properties[previous_marker] == previous_properties
-                # Reset in preparation of new line
-                previous_marker = current_marker
-                previous_coordinates = np.array(previous_coordinates[-1, :])
-            if current_marker != finalize_placeholder:
-                previous_coordinates = np.vstack((previous_coordinates, next_vertex))
+        # Transform all vertices with a single call to the transformer, and then split the domain in runs
+        # of consecutive segments with the same marker: each run is stored as a line, which connects the vertices
+        # from the first vertex of its first segment to the last vertex of its last segment
+        transformed_vertices = self._transform_coordinates(vertices).tolist()
+        runs_begin = [0, *(np.flatnonzero(np.diff(segment_markers) != 0) + 1).tolist()]
+        runs_end = [*runs_begin[1:], segment_markers.shape[0]]
+        segment_markers_list = segment_markers.tolist()
+        # Lines are grouped by marker in order of first occurrence, which is preserved by the dictionary
+        multiline_coordinates: collections.defaultdict[int, list[list[list[float]]]] = collections.defaultdict(list)
+        for (begin, end) in zip(runs_begin, runs_end):
+            multiline_coordinates[segment_markers_list[begin]].append(transformed_vertices[begin:end + 1])
 
         multiline_features = list()
-        for marker in multiline_coordinates.keys():
-            multiline = geojson.MultiLineString(coordinates=multiline_coordinates[marker])
-            feature = geojson.Feature(
-                geometry=multiline,
-                properties=multiline_properties[marker]
-            )
-            multiline_features.append(feature)
-        return geojson.FeatureCollection(multiline_features)
+        for (marker, coordinates) in multiline_coordinates.items():
+            multiline_features.append({
+                "type": "Feature",
+                "geometry": {"type": "MultiLineString", "coordinates": coordinates},
+                # Properties of the line only depend on its marker
+                "properties": {
+                    "color": colors[marker],
+                    "weight": int(weights[marker])
+                }
+            })
+        return {"type": "FeatureCollection", "features": multiline_features}
@@ -10,10 +10,17 @@ import typing
 import firedrake
 import folium
 import numpy as np
+import numpy.typing
 
 from femlium.base_mesh_plotter import BaseMeshPlotter
 from femlium.base_solution_plotter import BaseSolutionPlotter
 
+# The local face to vertex connectivity in FInAT is
+# 0: (1, 2), 1: (0, 2), 2: (0, 1)
+# while in FEMlium we assume
+# 0: (0, 1), 1: (1, 2), 2: (0, 2)
+_FINAT_TO_FEMLIUM = np.array([1, 2, 0], dtype=np.int64)
+
 
 class FiredrakePlotter(BaseMeshPlotter, BaseSolutionPlotter):
     """Interface of a geographic plotter for firedrake meshes and solutions."""
@@ -86,39 +93,31 @@ class FiredrakePlotter(BaseMeshPlotter, BaseSolutionPlotter):
             interior_facet_markers[mesh.interior_facets.measure_set("interior_facet", fm).indices] = fm
 
         face_markers = np.full(cells.shape, unmarked_face_marker, dtype=np.int64)
-        # The local face to vertex connectivity in FInAT is
-        # 0: (1, 2), 1: (0, 2), 2: (0, 1)
-        # while in FEMlium we assume
-        # 0: (0, 1), 1: (1, 2), 2: (0, 2)
-        finat_to_femlium = {0: 1, 1: 2, 2: 0}
 
+        # Markers of all exterior facets are assigned at once to the local face of their only cell
         exterior_facet_to_cell_connectivity = mesh.exterior_facets.facet_cell_map.values.reshape(-1)
         exterior_facet_reference_face_number = mesh.exterior_facets.local_facet_dat.data_ro.reshape(-1)
         assert exterior_facet_to_cell_connectivity.shape == exterior_facet_reference_face_number.shape
         assert len(exterior_facet_to_cell_connectivity.shape) == 1
-        for global_face_number in range(exterior_facet_to_cell_connectivity.shape[0]):
-            cell = exterior_facet_to_cell_connectivity[global_face_number]
-            femlium_face_number = finat_to_femlium[exterior_facet_reference_face_number[global_face_number]]
-            face_markers[cell, femlium_face_number] = exterior_facet_markers[global_face_number]
+        face_markers[
+            exterior_facet_to_cell_connectivity, _FINAT_TO_FEMLIUM[exterior_facet_reference_face_number]
+        ] = exterior_facet_markers
 
+        # Markers of all interior facets are assigned at once to the local faces of both their cells
         interior_facet_to_cell_connectivity = mesh.interior_facets.facet_cell_map.values
         interior_facet_reference_face_number = mesh.interior_facets.local_facet_dat.data_ro
         assert interior_facet_to_cell_connectivity.shape == interior_facet_reference_face_number.shape
         assert len(interior_facet_to_cell_connectivity.shape) == 2
-        for global_face_number in range(interior_facet_to_cell_connectivity.shape[0]):
-            cells_ = interior_facet_to_cell_connectivity[global_face_number, :].tolist()
-            femlium_face_numbers = [
-                finat_to_femlium[finat_face_number]
-                for finat_face_number in interior_facet_reference_face_number[global_face_number]]
-            for (cell, femlium_face_number) in zip(cells_, femlium_face_numbers):
-                face_markers[cell, femlium_face_number] = interior_facet_markers[global_face_number]
+        face_markers[
+            interior_facet_to_cell_connectivity, _FINAT_TO_FEMLIUM[interior_facet_reference_face_number]
+        ] = interior_facet_markers[:, np.newaxis]
 
         return BaseMeshPlotter.add_mesh_to(
             self, geo_map, vertices, cells, cell_markers, face_markers, cell_colors, face_colors, face_weights)
 
     def add_scalar_field_to(
         self, geo_map: folium.Map, scalar_field: firedrake.Function, mode: typing.Optional[str] = None,
-        levels: typing.Optional[typing.Union[int, list[float]]] = None,
+        levels: typing.Optional[typing.Union[int, list[float], np.typing.NDArray[np.float64]]] = None,
         cmap: typing.Optional[str] = None, name: typing.Optional[str] = None
     ) -> None:
         """
@@ -137,7 +136,7 @@ class FiredrakePlotter(BaseMeshPlotter, BaseSolutionPlotter):
             Values of the contour lines.
             If integer, it will determine the number of equispaced values to be used between
             the minimum and maximum entry of the scalar field.
-            If list, it will determine the values to be used.
+            If list or numpy array, it will determine the values to be used.
             If not provided, 10 levels are used by default.
         cmap
             matplotlib color map to be used.
@@ -150,15 +149,20 @@ class FiredrakePlotter(BaseMeshPlotter, BaseSolutionPlotter):
         scalar_function_space = firedrake.FunctionSpace(mesh, "CG", 1)
         vertices = mesh.coordinates.dat.data_ro
         cells = mesh.coordinates.cell_node_map().values
-        scalar_field_values = firedrake.interpolate(scalar_field, scalar_function_space).vector().array()
+        if scalar_field.function_space().ufl_element() == scalar_function_space.ufl_element():
+            # The field is already linear, hence its values can be used without any interpolation
+            scalar_field_values = scalar_field.dat.data_ro
+        else:
+            # Read the values of the interpolated field through a read-only view of its data, rather than a copy
+            scalar_field_values = firedrake.interpolate(scalar_field, scalar_function_space).dat.data_ro
 
         return BaseSolutionPlotter.add_scalar_field_to(
             self, geo_map, vertices, cells, scalar_field_values, mode, levels, cmap, name)
 
     def add_vector_field_to(
         self, geo_map: folium.Map, vector_field: firedrake.Function, mode: typing.Optional[str] = None,
-        levels: typing.Optional[typing.Union[int, list[float]]] = None, scale: typing.Optional[float] = None,
-        cmap: typing.Optional[str] = None, name: typing.Optional[str] = None
+        levels: typing.Optional[typing.Union[int, list[float], np.typing.NDArray[np.float64]]] = None,
+        scale: typing.Optional[float] = None, cmap: typing.Optional[str] = None, name: typing.Optional[str] = None
     ) -> None:
         """
         Add a vector field to a folium map.
@@ -177,7 +181,7 @@ class FiredrakePlotter(BaseMeshPlotter, BaseSolutionPlotter):
             In quiver mode: number of ticks to be added to the color bar.
             If integer, it will determine the number of equispaced values to be used between
             the minimum and maximum entry of the scalar field.
-            If list, it will determine the values to be used.
+            If list or numpy array, it will determine the values to be used.
             If not provided, 10 levels are used by default.
         scale
             This is only applicable for quiver mode: scaling to be applied before drawing arrows.
@@ -193,8 +197,13 @@ class FiredrakePlotter(BaseMeshPlotter, BaseSolutionPlotter):
         vector_function_space = firedrake.VectorFunctionSpace(mesh, "CG", 1)
         vertices = mesh.coordinates.dat.data_ro
         cells = mesh.coordinates.cell_node_map().values
-        vector_field_values = firedrake.interpolate(
-            vector_field, vector_function_space).vector().array().reshape(-1, 2)
+        # Data of a vector function space are already stored as a matrix with two columns
+        if vector_field.function_space().ufl_element() == vector_function_space.ufl_element():
+            # The field is already linear, hence its values can be used without any interpolation
+            vector_field_values = vector_field.dat.data_ro
+        else:
+            # Read the values of the interpolated field through a read-only view of its data, rather than a copy
+            vector_field_values = firedrake.interpolate(vector_field, vector_function_space).dat.data_ro
 
         return BaseSolutionPlotter.add_vector_field_to(
             self, geo_map, vertices, cells, vector_field_values, mode, levels, scale, cmap, name)
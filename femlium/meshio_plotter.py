@@ -56,7 +56,7 @@ class MeshioPlotter(BaseMeshPlotter):
         if unmarked_face_marker is None:
             unmarked_face_marker = 0
 
-        vertices = mesh.points[:, :2]
+        vertices = np.ascontiguousarray(mesh.points[:, :2])
         cells = mesh.cells_dict["triangle"]
 
         if "gmsh:physical" in mesh.cell_data_dict and "triangle" in mesh.cell_data_dict["gmsh:physical"]:
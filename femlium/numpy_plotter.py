@@ -5,6 +5,11 @@
 # SPDX-License-Identifier: MIT
 """Interface of a geographic plotter for solution-related plots with fields stored in numpy."""
 
+import typing
+
+import numpy as np
+import numpy.typing
+
 from femlium.base_solution_plotter import BaseSolutionPlotter
 
 
@@ -12,3 +17,36 @@ class NumpyPlotter(BaseSolutionPlotter):
     """Interface of a geographic plotter for solution-related plots with fields stored in numpy."""
 
     pass
+
+
+def from_triangle_list(
+    triangles: typing.Union[np.typing.ArrayLike, typing.Iterable[typing.Any]]
+) -> tuple[np.typing.NDArray[np.float64], np.typing.NDArray[np.int64]]:
+    """
+    Build the vertices and cells arrays of a triangular mesh from a list of triangles.
+
+    Coordinates of vertices shared by several triangles are merged, so that the returned arrays
+    can be directly passed to the add_mesh_to method of the plotters.
+    Note that if the mesh is already available as numpy arrays (e.g., as the output of a mesh generator)
+    those arrays should be preferred instead, since converting them to lists and back is unnecessary.
+
+    Parameters
+    ----------
+    triangles
+        Collection of triangles. Each triangle is defined by the coordinates of its three vertices,
+        so that the input can be converted to an array with shape (number of triangles, 3, 2).
+
+    Returns
+    -------
+    :
+        A pair containing the matrix of the coordinates of the vertices, with as many rows as unique vertices
+        and two columns, and the matrix of the connectivity of the cells, with as many rows as triangles
+        and three columns.
+    """
+    if not isinstance(triangles, (np.ndarray, list, tuple)):
+        triangles = list(triangles)
+    vertices_with_duplicates = np.asarray(triangles, dtype=np.float64).reshape(-1, 2)
+    assert vertices_with_duplicates.shape[0] % 3 == 0
+    vertices, inverse = np.unique(vertices_with_duplicates, axis=0, return_inverse=True)
+    cells = inverse.reshape(-1, 3).astype(np.int64)
+    return vertices, cells
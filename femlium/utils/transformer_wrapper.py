@@ -27,10 +27,13 @@ class TransformerWrapper:
     ----------
     transformer
         The first input parameter.
+    is_identity
+        Whether no transformer has been provided, and thus the identity map is used.
     """
 
     def __init__(self, transformer: typing.Optional[pyproj.Transformer]) -> None:
         self.transformer = transformer
+        self.is_identity = transformer is None
 
     def __call__(self, *args: np.float64) -> np.typing.NDArray[np.float64]:
         """
@@ -46,7 +49,30 @@ class TransformerWrapper:
         :
             Output coordinates after transformation.
         """
-        if self.transformer is None:
+        if self.is_identity:
             return args
         else:
             return self.transformer.transform(*args)
+
+    def batch(self, coordinates: np.typing.NDArray[np.float64]) -> np.typing.NDArray[np.float64]:
+        """
+        Apply the transformation to several points at once, with a single call to the underlying transformer.
+
+        Parameters
+        ----------
+        coordinates
+            Matrix containing the input coordinates.
+            The matrix should have as many rows as points, and two columns.
+
+        Returns
+        -------
+        :
+            Matrix containing the output coordinates after transformation, with the same shape of the input matrix.
+        """
+        coordinates = np.asarray(coordinates, dtype=np.float64)
+        assert len(coordinates.shape) == 2 and coordinates.shape[1] == 2
+        if self.is_identity:
+            # Return the input matrix itself, without any copy
+            return coordinates
+        else:
+            return np.column_stack(self.transformer.transform(coordinates[:, 0], coordinates[:, 1]))
@@ -212,7 +212,7 @@ def test_base_mesh_plotter_add_mesh_to_map_vertices_cells_multiple_face_markers(
     (stroke property equal to false) because different faces might need different colors, and its faces
     are represented as standalone segments.
     Note that this is not really needed here, because all face markers would be represented anyway by
-    the same face color.
+    the same face color: for this reason, all faces are stored in the same feature.
     """
     geo_map = folium.Map(location=[0, 0], zoom_start=8)
     mesh_plotter = femlium.BaseMeshPlotter()
@@ -251,7 +251,7 @@ def test_base_mesh_plotter_add_mesh_to_map_vertices_cells_multiple_face_markers(
             "type": "Feature"
         }, {
             "geometry": {
-                "coordinates": [[[0.0, 0.0], [1.0, 1.0]]],
+                "coordinates": [[[0.0, 0.0], [1.0, 1.0]], [[1.0, 1.0], [0.0, 1.0]], [[0.0, 0.0], [0.0, 1.0]]],
                 "type": "MultiLineString"
             },
             "id": "2",
@@ -261,30 +261,6 @@ def test_base_mesh_plotter_add_mesh_to_map_vertices_cells_multiple_face_markers(
                 "weight": 1
             },
             "type": "Feature"
-        }, {
-            "geometry": {
-                "coordinates": [[[1.0, 1.0], [0.0, 1.0]]],
-                "type": "MultiLineString"
-            },
-            "id": "3",
-            "properties": {
-                "color": "black",
-                "stroke": True,
-                "weight": 1
-            },
-            "type": "Feature"
-        }, {
-            "geometry": {
-                "coordinates": [[[0.0, 0.0], [0.0, 1.0]]],
-                "type": "MultiLineString"
-            },
-            "id": "4",
-            "properties": {
-                "color": "black",
-                "stroke": True,
-                "weight": 1
-            },
-            "type": "Feature"
         }],
         "type": "FeatureCollection"
     }
@@ -623,6 +599,7 @@ def test_base_mesh_plotter_add_mesh_to_map_vertices_cells_multiple_cell_markers(
     Test femlium.BaseMeshPlotter.add_mesh_to providing vertices, cells, where cells have different markers.
 
     The default cell color will be used in all cases, which corresponds to not coloring the cell at all.
+    Since both cells have the same appearance, they are stored in the same feature.
     """
     geo_map = folium.Map(location=[0, 0], zoom_start=8)
     mesh_plotter = femlium.BaseMeshPlotter()
@@ -631,25 +608,12 @@ def test_base_mesh_plotter_add_mesh_to_map_vertices_cells_multiple_cell_markers(
     expected_geojson = {
         "features": [{
             "geometry": {
-                "coordinates": [[[[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 0.0]]]],
-                "type": "MultiPolygon"
-            },
-            "id": "0",
-            "properties": {
-                "color": "black",
-                "fill": False,
-                "fillColor": None,
-                "fillOpacity": None,
-                "stroke": True,
-                "weight": 1
-            },
-            "type": "Feature"
-        }, {
-            "geometry": {
-                "coordinates": [[[[0.0, 0.0], [1.0, 1.0], [0.0, 1.0], [0.0, 0.0]]]],
+                "coordinates": [
+                    [[[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 0.0]]],
+                    [[[0.0, 0.0], [1.0, 1.0], [0.0, 1.0], [0.0, 0.0]]]
+                ],
                 "type": "MultiPolygon"
             },
-            "id": "1",
             "properties": {
                 "color": "black",
                 "fill": False,
@@ -776,3 +740,91 @@ def test_base_mesh_plotter_add_mesh_to_map_vertices_cells_multiple_cell_markers_
 
     # Confirm absence of color bar
     assert "d3.scale.linear()" not in geo_map_html
+
+
+def test_base_mesh_plotter_add_mesh_to_map_vertices_cells_shared_face(
+    vertices: np.typing.NDArray[np.float64], cells: np.typing.NDArray[np.int64]
+) -> None:
+    """
+    Test femlium.BaseMeshPlotter.add_mesh_to providing vertices, cells, where both cells have different face markers.
+
+    The face shared by the two cells must be represented only once.
+    """
+    geo_map = folium.Map(location=[0, 0], zoom_start=8)
+    mesh_plotter = femlium.BaseMeshPlotter()
+    face_markers = np.array([[1, 1, 2], [2, 1, 1]], dtype=np.int64)
+    face_colors = {1: "red", 2: "blue"}
+    mesh_plotter.add_mesh_to(geo_map, vertices, cells, face_markers=face_markers, face_colors=face_colors)
+
+    expected_geojson = {
+        "features": [{
+            "geometry": {
+                "coordinates": [
+                    [[[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 0.0]]],
+                    [[[0.0, 0.0], [1.0, 1.0], [0.0, 1.0], [0.0, 0.0]]]
+                ],
+                "type": "MultiPolygon"
+            },
+            "id": "0",
+            "properties": {
+                "color": None,
+                "fill": False,
+                "fillColor": None,
+                "fillOpacity": None,
+                "stroke": False,
+                "weight": None
+            },
+            "type": "Feature"
+        }, {
+            "geometry": {
+                "coordinates": [
+                    [[0.0, 0.0], [1.0, 0.0]], [[1.0, 0.0], [1.0, 1.0]],
+                    [[1.0, 1.0], [0.0, 1.0]], [[0.0, 0.0], [0.0, 1.0]]
+                ],
+                "type": "MultiLineString"
+            },
+            "id": "1",
+            "properties": {
+                "color": "red",
+                "stroke": True,
+                "weight": 1
+            },
+            "type": "Feature"
+        }, {
+            "geometry": {
+                "coordinates": [[[0.0, 0.0], [1.0, 1.0]]],
+                "type": "MultiLineString"
+            },
+            "id": "2",
+            "properties": {
+                "color": "blue",
+                "stroke": True,
+                "weight": 1
+            },
+            "type": "Feature"
+        }],
+        "type": "FeatureCollection"
+    }
+    expected_geojson = folium.utilities.normalize(json.dumps(expected_geojson))
+    assert expected_geojson in folium.utilities.normalize(geo_map._parent.render())
+
+
+def test_base_mesh_plotter_mesh_to_geojson(
+    vertices: np.typing.NDArray[np.float64], cells: np.typing.NDArray[np.int64],
+    multiple_face_markers: np.typing.NDArray[np.int64]
+) -> None:
+    """Test that a geojson returned by femlium.BaseMeshPlotter.mesh_to_geojson can be reused on several maps."""
+    mesh_plotter = femlium.BaseMeshPlotter()
+    mesh_geojson = mesh_plotter.mesh_to_geojson(vertices, cells, face_markers=multiple_face_markers)
+    assert mesh_geojson["type"] == "FeatureCollection"
+    assert len(mesh_geojson["features"]) == 3
+
+    geo_map = folium.Map(location=[0, 0], zoom_start=8)
+    mesh_plotter.add_mesh_to(geo_map, vertices, cells, face_markers=multiple_face_markers)
+    data = [child.data for child in geo_map._children.values() if isinstance(child, folium.GeoJson)]
+    for cached_mesh_geojson in (mesh_geojson, json.dumps(mesh_geojson)):
+        cached_geo_map = folium.Map(location=[0, 0], zoom_start=8)
+        mesh_plotter.add_mesh_geojson_to(cached_geo_map, cached_mesh_geojson)
+        cached_data = [
+            child.data for child in cached_geo_map._children.values() if isinstance(child, folium.GeoJson)]
+        assert cached_data == data
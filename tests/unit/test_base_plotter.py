@@ -0,0 +1,45 @@
+# Copyright (C) 2021-2025 by the FEMlium authors
+#
+# This file is part of FEMlium.
+#
+# SPDX-License-Identifier: MIT
+"""Tests for femlium.base_plotter module."""
+
+import numpy as np
+
+import femlium.base_plotter
+
+
+def test_base_plotter_process_optional_argument_on_markers_dict() -> None:
+    """Test femlium.base_plotter.BasePlotter._process_optional_argument_on_markers with a dictionary argument."""
+    output = femlium.base_plotter.BasePlotter._process_optional_argument_on_markers(
+        {2: "red", 0: "blue"}, "black", np.array([0, 2, 3]))
+    assert output.tolist() == ["blue", "black", "red", "black"]
+    assert not output.flags.writeable
+
+
+def test_base_plotter_process_optional_argument_on_markers_cached() -> None:
+    """Test that femlium.base_plotter.BasePlotter._process_optional_argument_on_markers reuses cached results."""
+    first = femlium.base_plotter.BasePlotter._process_optional_argument_on_markers(
+        {1: 2, 0: 3}, 1, np.array([0, 1]))
+    second = femlium.base_plotter.BasePlotter._process_optional_argument_on_markers(
+        {0: 3, 1: 2}, 1, np.array([0, 1]))
+    assert first is second
+    assert first.tolist() == [3, 2]
+
+
+def test_base_plotter_transform_coordinates() -> None:
+    """Test that femlium.base_plotter.BasePlotter._transform_coordinates rounds to six decimal places."""
+    plotter = femlium.base_plotter.BasePlotter()
+    output = plotter._transform_coordinates(np.array([[1 / 3, 2 / 3]]))
+    assert output.tolist() == [[0.333333, 0.666667]]
+
+
+def test_base_plotter_transform_vertices_cached() -> None:
+    """Test that femlium.base_plotter.BasePlotter._transform_vertices reuses the result on the same vertices."""
+    plotter = femlium.base_plotter.BasePlotter()
+    vertices = np.array([[0., 0.], [1., 0.], [1., 1.]])
+    first = plotter._transform_vertices(vertices)
+    assert not first.flags.writeable
+    assert plotter._transform_vertices(vertices.copy()) is first
+    assert plotter._transform_vertices(vertices * 2) is not first
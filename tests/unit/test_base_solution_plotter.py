@@ -0,0 +1,154 @@
+# Copyright (C) 2021-2025 by the FEMlium authors
+#
+# This file is part of FEMlium.
+#
+# SPDX-License-Identifier: MIT
+"""Tests for femlium.base_solution_plotter module."""
+
+import typing
+
+import matplotlib as mpl
+import matplotlib.pyplot as plt
+import numpy as np
+import numpy.typing
+import pyproj
+import pytest
+
+import femlium
+
+
+@pytest.fixture
+def transformer() -> pyproj.Transformer:
+    """Transform between EPSG 3395 used in the definition of the vertices and EPSG 4326 used on the map."""
+    return pyproj.Transformer.from_crs("epsg:3395", "epsg:4326", always_xy=True)
+
+
+@pytest.fixture
+def vertices() -> np.typing.NDArray[np.float64]:
+    """Vertices of a unit square domain divided in two triangular cells."""
+    return np.array([[0., 0.], [1., 0.], [1., 1.], [0., 1.]])
+
+
+@pytest.fixture
+def cells() -> np.typing.NDArray[np.int64]:
+    """Cells of a unit square domain divided in two triangular cells."""
+    return np.array([[0, 1, 2], [0, 2, 3]], dtype=np.int64)
+
+
+def test_base_solution_plotter_triangulation_cache(
+    vertices: np.typing.NDArray[np.float64], cells: np.typing.NDArray[np.int64]
+) -> None:
+    """Test that femlium.BaseSolutionPlotter reuses the triangulation when plotting several fields on a mesh."""
+    solution_plotter = femlium.BaseSolutionPlotter()
+    solution_plotter._create_contour_generator(vertices, cells, vertices[:, 0])
+    assert solution_plotter._triangulation_cache is not None
+    cpp_triangulation = solution_plotter._triangulation_cache[2]
+
+    solution_plotter._create_contour_generator(vertices.copy(), cells.copy(), vertices[:, 1])
+    assert solution_plotter._triangulation_cache[2] is cpp_triangulation
+
+    solution_plotter._create_contour_generator(vertices * 2, cells, vertices[:, 1])
+    assert solution_plotter._triangulation_cache[2] is not cpp_triangulation
+
+
+@pytest.mark.parametrize("lut", [5, 256])
+def test_base_solution_plotter_colormap_indices(lut: int) -> None:
+    """Test that evaluating a color map on its lookup table indices gives the same colors as matplotlib."""
+    cmap = plt.get_cmap("viridis", lut=lut).with_extremes(under="red", over="blue", bad="green")
+    values = np.concatenate((np.linspace(-0.2, 1.2, 1001), [0., 1., np.nan]))
+    indices = femlium.BaseSolutionPlotter._colormap_indices(cmap, values)
+    assert np.array_equal(femlium.BaseSolutionPlotter._colormap_colors(cmap, indices), cmap(values))
+
+
+@pytest.mark.parametrize("mode", ["contour", "contourf"])
+def test_base_solution_plotter_levels_out_of_range(
+    vertices: np.typing.NDArray[np.float64], cells: np.typing.NDArray[np.int64], mode: str
+) -> None:
+    """Test that femlium.BaseSolutionPlotter only generates features for levels within the range of the field."""
+    solution_plotter = femlium.BaseSolutionPlotter()
+    levels = np.array([-2., -1., 0.5, 2., 3.])
+    colors = ["#000000", "#111111", "#222222", "#333333", "#444444"]
+    json = solution_plotter._convert_scalar_field_to_geojson(vertices, cells, vertices[:, 0], mode, levels, colors)
+    feature_colors = [feature["properties"].get("color", feature["properties"].get("fillColor"))
+                      for feature in json["features"]]
+    if mode == "contour":
+        assert feature_colors == ["#222222"]
+    else:
+        assert feature_colors == ["#111111", "#222222"]
+
+
+def test_base_solution_plotter_colormap_hex_table() -> None:
+    """Test that the hex table of a color map gives the same colors as matplotlib.colors.to_hex."""
+    cmap = plt.get_cmap("jet", lut=7).with_extremes(under="red", over="blue", bad="green")
+    values = np.array([-0.5, 0., 0.3, 0.5, 1., 1.5, np.nan])
+    hex_table = femlium.BaseSolutionPlotter._colormap_hex_table(cmap)
+    colors = hex_table[femlium.BaseSolutionPlotter._colormap_indices(cmap, values)].tolist()
+    assert colors == [mpl.colors.to_hex(rgba) for rgba in cmap(values)]
+
+
+@pytest.mark.parametrize("mode", ["contour", "contourf"])
+def test_base_solution_plotter_transform_first(
+    vertices: np.typing.NDArray[np.float64], cells: np.typing.NDArray[np.int64], mode: str
+) -> None:
+    """Test that femlium.BaseSolutionPlotter gives the same contours with transform_first and the identity map."""
+    levels = np.array([0., 0.25, 0.5, 0.75, 1.])
+    colors = ["#000000", "#111111", "#222222", "#333333", "#444444"]
+    scalar_field = vertices[:, 0] * vertices[:, 1]
+    expected = femlium.BaseSolutionPlotter()._convert_scalar_field_to_geojson(
+        vertices, cells, scalar_field, mode, levels, colors)
+    solution_plotter = femlium.BaseSolutionPlotter(transform_first=True)
+    assert solution_plotter._convert_scalar_field_to_geojson(
+        vertices, cells, scalar_field, mode, levels, colors) == expected
+
+
+@pytest.mark.parametrize("mode", ["contour", "contourf"])
+def test_base_solution_plotter_transform_first_with_transformer(
+    vertices: np.typing.NDArray[np.float64], cells: np.typing.NDArray[np.int64], transformer: pyproj.Transformer,
+    mode: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that femlium.BaseSolutionPlotter with transform_first only transforms the vertices of the mesh."""
+    mesh_vertices = np.array([1.18e6, 5.69e6]) + 1.e4 * vertices
+    levels = np.array([0., 0.25, 0.5, 0.75, 1.])
+    colors = ["#000000", "#111111", "#222222", "#333333", "#444444"]
+    scalar_field = vertices[:, 0] * vertices[:, 1]
+    solution_plotter = femlium.BaseSolutionPlotter(transformer, transform_first=True)
+    transform_coordinates = solution_plotter._transform_coordinates
+    transformed_coordinates = list()
+
+    def spy_transform_coordinates(coordinates: np.typing.NDArray[np.float64]) -> np.typing.NDArray[np.float64]:
+        transformed_coordinates.append(coordinates)
+        return transform_coordinates(coordinates)
+
+    monkeypatch.setattr(solution_plotter, "_transform_coordinates", spy_transform_coordinates)
+    json = solution_plotter._convert_scalar_field_to_geojson(
+        mesh_vertices, cells, scalar_field, mode, levels, colors)
+    assert len(transformed_coordinates) == 1
+    assert np.array_equal(transformed_coordinates[0], mesh_vertices)
+
+    # Contours are computed on the transformed mesh, hence their points are already in the output CRS,
+    # within the bounds of the transformed mesh (and attaining them in contourf mode, which covers the mesh)
+    transformed_vertices = transform_coordinates(mesh_vertices)
+    if mode == "contour":
+        points = np.array([
+            point for feature in json["features"] for curve in feature["geometry"]["coordinates"]
+            for point in curve])
+    else:
+        points = np.array([
+            point for feature in json["features"] for polygon in feature["geometry"]["coordinates"]
+            for curve in polygon for point in curve])
+    assert points.shape[0] > 0
+    assert np.all(points >= transformed_vertices.min(axis=0))
+    assert np.all(points <= transformed_vertices.max(axis=0))
+    if mode == "contourf":
+        assert np.array_equal(points.min(axis=0), transformed_vertices.min(axis=0))
+        assert np.array_equal(points.max(axis=0), transformed_vertices.max(axis=0))
+
+
+@pytest.mark.parametrize("levels", [3, [0., 0.5, 1.], np.array([0., 0.5, 1.])])
+def test_base_solution_plotter_process_levels(
+    vertices: np.typing.NDArray[np.float64], levels: typing.Union[int, list[float], np.typing.NDArray[np.float64]]
+) -> None:
+    """Test that femlium.BaseSolutionPlotter accepts levels as an integer, a list or a numpy array."""
+    processed_levels, cmap, _ = femlium.BaseSolutionPlotter._process_levels_and_cmap(vertices[:, 0], levels, None)
+    assert processed_levels.tolist() == [0., 0.5, 1.]
+    assert cmap.N == 3
@@ -0,0 +1,36 @@
+# Copyright (C) 2021-2025 by the FEMlium authors
+#
+# This file is part of FEMlium.
+#
+# SPDX-License-Identifier: MIT
+"""Tests for femlium.dolfinx_plotter module."""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("dolfinx")
+
+import basix.ufl
+import dolfinx.fem
+import dolfinx.mesh
+import mpi4py.MPI
+
+import femlium
+
+
+def test_dolfinx_plotter_mixed_function_space_component() -> None:
+    """Test that femlium.DolfinxPlotter interpolates a linear component of a function on a mixed space."""
+    mesh = dolfinx.mesh.create_unit_square(mpi4py.MPI.COMM_WORLD, 2, 2)
+    velocity_element = basix.ufl.element("Lagrange", mesh.basix_cell(), 2, shape=(mesh.geometry.dim, ))
+    pressure_element = basix.ufl.element("Lagrange", mesh.basix_cell(), 1)
+    mixed_function_space = dolfinx.fem.functionspace(
+        mesh, basix.ufl.mixed_element([velocity_element, pressure_element]))
+    solution = dolfinx.fem.Function(mixed_function_space)
+    solution.sub(1).interpolate(lambda x: x[0] + 2 * x[1])
+
+    plotter = femlium.DolfinxPlotter()
+    vertices, _, values = plotter._get_values_on_linear_function_space(solution.sub(1), ())
+    assert values.shape == (vertices.shape[0], )
+    assert np.allclose(values, vertices[:, 0] + 2 * vertices[:, 1])
+    for (_, function_space, _, _) in plotter._linear_function_spaces_cache.values():
+        assert len(function_space.component()) == 0
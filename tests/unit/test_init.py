@@ -0,0 +1,42 @@
+# Copyright (C) 2021-2025 by the FEMlium authors
+#
+# This file is part of FEMlium.
+#
+# SPDX-License-Identifier: MIT
+"""Tests for femlium main module."""
+
+import importlib.machinery
+import importlib.util
+import typing
+
+import pytest
+
+import femlium
+
+
+def test_init_dir_optional_plotters(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that optional plotters are listed by dir(femlium) only when their backend is available."""
+    for name in femlium._optional_plotters:
+        monkeypatch.delitem(vars(femlium), name, raising=False)
+    monkeypatch.setattr(
+        importlib.util, "find_spec",
+        lambda name, *args: importlib.machinery.ModuleSpec(name, None) if name == "meshio" else None)
+    names = dir(femlium)
+    assert "NumpyPlotter" in names
+    assert "MeshioPlotter" in names
+    assert "DolfinPlotter" not in names
+    assert "DolfinxPlotter" not in names
+    assert "FiredrakePlotter" not in names
+
+
+def test_init_star_import() -> None:
+    """Test that from femlium import * provides the plotters, including optional ones whose backend is available."""
+    namespace: dict[str, typing.Any] = dict()
+    exec("from femlium import *", namespace)
+    assert "NumpyPlotter" in namespace
+    assert "from_triangle_list" in namespace
+    for (name, (backend, _)) in femlium._optional_plotters.items():
+        if importlib.util.find_spec(backend) is not None:
+            assert name in namespace
+        else:
+            assert name not in namespace
@@ -0,0 +1,31 @@
+# Copyright (C) 2021-2025 by the FEMlium authors
+#
+# This file is part of FEMlium.
+#
+# SPDX-License-Identifier: MIT
+"""Tests for femlium.numpy_plotter module."""
+
+import numpy as np
+
+import femlium
+
+
+def test_from_triangle_list() -> None:
+    """Test femlium.from_triangle_list on a unit square domain divided in two triangular cells."""
+    triangles = [
+        [[0., 0.], [1., 0.], [1., 1.]],
+        [[0., 0.], [1., 1.], [0., 1.]]
+    ]
+    vertices, cells = femlium.from_triangle_list(triangles)
+    assert vertices.shape == (4, 2)
+    assert cells.shape == (2, 3)
+    assert cells.dtype == np.int64
+    assert np.array_equal(vertices[cells], np.array(triangles))
+
+
+def test_from_triangle_list_generator() -> None:
+    """Test femlium.from_triangle_list when triangles are provided by a generator."""
+    vertices, cells = femlium.from_triangle_list(
+        ((0., 0.), (1., 0.), (float(i), 1.)) for i in range(3))
+    assert vertices.shape == (5, 2)
+    assert cells.shape == (3, 3)
@@ -0,0 +1,42 @@
+# Copyright (C) 2021-2025 by the FEMlium authors
+#
+# This file is part of FEMlium.
+#
+# SPDX-License-Identifier: MIT
+"""Tests for femlium.utils.transformer_wrapper module."""
+
+import numpy as np
+import numpy.typing
+import pyproj
+import pytest
+
+import femlium.utils
+
+
+@pytest.fixture
+def transformer() -> pyproj.Transformer:
+    """Transform between EPSG 3395 used in the definition of the vertices and EPSG 4326 used on the map."""
+    return pyproj.Transformer.from_crs("epsg:3395", "epsg:4326", always_xy=True)
+
+
+@pytest.fixture
+def points() -> np.typing.NDArray[np.float64]:
+    """Vertices of a unit square domain, scaled to be in the order of magnitude of 100km."""
+    return np.array([[0., 0.], [1., 0.], [1., 1.], [0., 1.]]) * 1e5
+
+
+def test_transformer_wrapper_batch_without_transformer(points: np.typing.NDArray[np.float64]) -> None:
+    """Test femlium.utils.TransformerWrapper.batch in a case without a transformer."""
+    transformer_wrapper = femlium.utils.TransformerWrapper(None)
+    assert transformer_wrapper.is_identity
+    assert transformer_wrapper.batch(points) is points
+
+
+def test_transformer_wrapper_batch_with_transformer(
+    transformer: pyproj.Transformer, points: np.typing.NDArray[np.float64]
+) -> None:
+    """Test femlium.utils.TransformerWrapper.batch against the transformation of one point at a time."""
+    transformer_wrapper = femlium.utils.TransformerWrapper(transformer)
+    assert not transformer_wrapper.is_identity
+    expected = np.array([transformer_wrapper(*point) for point in points])
+    assert np.allclose(transformer_wrapper.batch(points), expected)